@@ -0,0 +1,145 @@
+"""On-disk cache for GitHub API responses.
+
+Responses are stored alongside their ETags so repeat requests can be revalidated
+with If-None-Match; GitHub answers unchanged resources with 304, which does not
+count against the primary rate limit. Responses also record when they were last
+confirmed current, so callers can reuse very recent ones without a request. Logs
+of completed jobs never change, so they are stored by job ID and served without
+any request at all.
+
+Every entry is scoped to the token it was fetched with, so one token's private
+data is never served to another, and the database is readable by its owner only. Entries not refreshed within CACHE_MAX_AGE_SECONDS
+are pruned whenever the database is opened.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .constants import CACHE_MAX_AGE_SECONDS
+
+# Bumped whenever the tables change; older databases are dropped and recreated
+_SCHEMA_VERSION = 1
+
+
+def default_cache_path() -> Path:
+    """Return the cache database location, honoring XDG_CACHE_HOME."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "cimonitor" / "http.db"
+
+
+class ResponseCache:
+    """SQLite-backed store for ETag-tagged API responses and completed job logs.
+
+    The database is opened lazily on first use. Any storage error disables the
+    cache for the rest of the process instead of failing the request. The scope
+    passed to each method partitions entries, e.g. by a hash of the API token.
+    """
+
+    def __init__(self, path: Path | None = None, max_age: float = CACHE_MAX_AGE_SECONDS):
+        self.path = path or default_cache_path()
+        self.max_age = max_age
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        # Fetches run on worker threads, so serialize access to the connection
+        self._lock = threading.Lock()
+
+    def get_response(self, scope: str, key: str) -> tuple[str, str, float] | None:
+        """Return the cached (etag, body, fetched_at) for a request key, if any."""
+        row = self._query_one(
+            "SELECT etag, body, fetched_at FROM responses WHERE scope = ? AND key = ?",
+            (scope, key),
+        )
+        return (row[0], row[1], row[2]) if row else None
+
+    def store_response(self, scope: str, key: str, etag: str, body: str) -> None:
+        """Store a response body together with the ETag it was served with."""
+        self._execute(
+            "INSERT OR REPLACE INTO responses (scope, key, etag, body, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (scope, key, etag, body, time.time()),
+        )
+
+    def touch_response(self, scope: str, key: str) -> None:
+        """Record that a cached response was just confirmed current (e.g. by a 304)."""
+        self._execute(
+            "UPDATE responses SET fetched_at = ? WHERE scope = ? AND key = ?",
+            (time.time(), scope, key),
+        )
+
+    def get_job_logs(self, scope: str, job_id: int) -> str | None:
+        """Return cached logs for a completed job, if any."""
+        row = self._query_one(
+            "SELECT body FROM job_logs WHERE scope = ? AND job_id = ?", (scope, job_id)
+        )
+        return row[0] if row else None
+
+    def store_job_logs(self, scope: str, job_id: int, body: str) -> None:
+        """Store logs for a completed job. Completed job logs are immutable."""
+        self._execute(
+            "INSERT OR REPLACE INTO job_logs (scope, job_id, body, fetched_at) VALUES (?, ?, ?, ?)",
+            (scope, job_id, body, time.time()),
+        )
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open the database, create tables and prune expired entries on first use."""
+        if self._conn is not None or self._disabled:
+            return self._conn
+
+        try:
+            # Cached bodies and logs can come from private repositories, so keep
+            # the directory and database readable by the current user only
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            os.chmod(self.path.parent, 0o700)
+            os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+            os.chmod(self.path, 0o600)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS responses")
+                conn.execute("DROP TABLE IF EXISTS job_logs")
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(scope TEXT NOT NULL, key TEXT NOT NULL, etag TEXT NOT NULL, body TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, PRIMARY KEY (scope, key))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_logs "
+                "(scope TEXT NOT NULL, job_id INTEGER NOT NULL, body TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, PRIMARY KEY (scope, job_id))"
+            )
+            # Without a size limit the database would keep every log ever viewed
+            expired = time.time() - self.max_age
+            conn.execute("DELETE FROM responses WHERE fetched_at < ?", (expired,))
+            conn.execute("DELETE FROM job_logs WHERE fetched_at < ?", (expired,))
+            conn.commit()
+        except (OSError, sqlite3.Error):
+            # An unwritable cache directory shouldn't break the CLI
+            self._disabled = True
+            return None
+
+        self._conn = conn
+        return conn
+
+    def _query_one(self, sql: str, params: tuple) -> tuple | None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                return conn.execute(sql, params).fetchone()
+            except sqlite3.Error:
+                return None
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(sql, params)
+                conn.commit()
+            except sqlite3.Error:
+                pass
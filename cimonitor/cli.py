@@ -1,13 +1,23 @@
 """Command-line interface for CI Monitor."""
 
+import json
+import os
+import random
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 
-from .constants import MAX_POLLS, POLL_INTERVAL_SECONDS, RETRY_SLEEP_SECONDS
-from .fetcher import GitHubCIFetcher
+from .constants import (
+    MAX_CONCURRENT_REQUESTS,
+    MAX_POLL_INTERVAL_SECONDS,
+    MIN_POLL_INTERVAL_SECONDS,
+    POLL_JITTER_SECONDS,
+    RETRY_SLEEP_SECONDS,
+    WATCH_TIMEOUT_SECONDS,
+)
 from .services import (
     get_ci_status,
     get_job_details_for_status,
@@ -16,6 +26,15 @@ from .services import (
     watch_ci_status,
 )
 
+# Section separators, built once rather than per printed job
+_EQUALS_60 = "=" * 60
+_EQUALS_80 = "=" * 80
+_DASHES_50 = "-" * 50
+_DASHES_80 = "-" * 80
+
+# Icons for step conclusions other than success/failure, which are summarized separately
+_STEP_CONCLUSION_ICONS = {"skipped": "⏭️", "cancelled": "🚫"}
+
 
 def parse_pr_input(pr_input):
     """Parse PR input - can be either a number or a GitHub PR URL.
@@ -73,7 +92,37 @@ def parse_repo_input(repo_input):
     return owner, repo_name
 
 
+def _create_fetcher():
+    """Create the GitHub fetcher with its on-disk cache.
+
+    requests and sqlite3 are only imported here, once a command actually runs,
+    so `--help` and option errors don't pay for them. Setting CIMONITOR_NO_CACHE
+    disables the on-disk cache.
+    """
+    from .cache import ResponseCache
+    from .fetcher import GitHubCIFetcher
+
+    if os.getenv("CIMONITOR_NO_CACHE"):
+        return GitHubCIFetcher()
+    return GitHubCIFetcher(cache=ResponseCache())
+
+
 # Shared options for targeting commits/PRs/branches
+def json_option(f):
+    """Add the --json flag for machine-readable NDJSON output."""
+    return click.option(
+        "--json",
+        "as_json",
+        is_flag=True,
+        help="Print one JSON object per line instead of text (progress goes to stderr)",
+    )(f)
+
+
+def _echo_json(obj):
+    """Print an object as a single NDJSON line."""
+    click.echo(json.dumps(obj, ensure_ascii=False))
+
+
 def target_options(f):
     """Decorator to add common targeting options."""
     f = click.option(
@@ -96,8 +145,11 @@ def validate_target_options(branch, commit, pr):
         sys.exit(1)
 
 
-def get_target_info(fetcher, repo, branch, commit, pr, verbose=False):
-    """Get target commit SHA and description from options."""
+def get_target_info(fetcher, repo, branch, commit, pr, verbose=False, as_json=False):
+    """Get target commit SHA and description from options.
+
+    Verbose details go to stderr with as_json, keeping stdout pure NDJSON.
+    """
 
     # Parse inputs
     repo_owner, repo_name_from_arg = parse_repo_input(repo) if repo else (None, None)
@@ -112,7 +164,7 @@ def get_target_info(fetcher, repo, branch, commit, pr, verbose=False):
         owner, repo_name = fetcher.get_repo_info()
 
     if verbose:
-        click.echo(f"Repository: {owner}/{repo_name}")
+        click.echo(f"Repository: {owner}/{repo_name}", err=as_json)
 
     # Determine target commit SHA and description
     repo_suffix = f" in {owner}/{repo_name}" if repo_owner and repo_name_from_arg else ""
@@ -124,27 +176,27 @@ def get_target_info(fetcher, repo, branch, commit, pr, verbose=False):
         else:
             target_description = f"PR #{pr_number}{repo_suffix}"
         if verbose:
-            click.echo(f"Pull Request: #{pr_number}")
-            click.echo(f"Head commit: {commit_sha}")
+            click.echo(f"Pull Request: #{pr_number}", err=as_json)
+            click.echo(f"Head commit: {commit_sha}", err=as_json)
     elif commit:
         commit_sha = fetcher.resolve_commit_sha(owner, repo_name, commit)
         target_description = f"commit {commit[:8] if len(commit) >= 8 else commit}{repo_suffix}"
         if verbose:
-            click.echo(f"Commit: {commit}")
-            click.echo(f"Resolved SHA: {commit_sha}")
+            click.echo(f"Commit: {commit}", err=as_json)
+            click.echo(f"Resolved SHA: {commit_sha}", err=as_json)
     elif branch:
         commit_sha = fetcher.get_branch_head_sha(owner, repo_name, branch)
         target_description = f"branch {branch}{repo_suffix}"
         if verbose:
-            click.echo(f"Branch: {branch}")
-            click.echo(f"Head commit: {commit_sha}")
+            click.echo(f"Branch: {branch}", err=as_json)
+            click.echo(f"Head commit: {commit_sha}", err=as_json)
     else:
         # Default: use current branch and commit
         current_branch, commit_sha = fetcher.get_current_branch_and_commit()
         target_description = f"current branch ({current_branch}){repo_suffix}"
         if verbose:
-            click.echo(f"Branch: {current_branch}")
-            click.echo(f"Latest commit: {commit_sha}")
+            click.echo(f"Branch: {current_branch}", err=as_json)
+            click.echo(f"Latest commit: {commit_sha}", err=as_json)
 
     return owner, repo_name, commit_sha, target_description, pr_number
 
@@ -162,13 +214,14 @@ def cli(ctx):
 @cli.command()
 @target_options
 @click.option("--verbose", "-v", is_flag=True, help="Show verbose output")
-def status(repo, branch, commit, pr, verbose):
+@json_option
+def status(repo, branch, commit, pr, verbose, as_json):
     """Show CI status for the target commit/branch/PR."""
     try:
         validate_target_options(branch, commit, pr)
-        fetcher = GitHubCIFetcher()
+        fetcher = _create_fetcher()
         owner, repo_name, commit_sha, target_description, pr_number = get_target_info(
-            fetcher, repo, branch, commit, pr, verbose
+            fetcher, repo, branch, commit, pr, verbose, as_json
         )
 
         # Get CI status using business logic
@@ -178,16 +231,19 @@ def status(repo, branch, commit, pr, verbose):
 
         # Check for merge conflicts first - only show if there are actual conflicts
         if ci_status.merge_conflict_info and _has_merge_conflicts(ci_status.merge_conflict_info):
-            _handle_merge_conflict_status(ci_status)
+            if as_json:
+                _echo_json({"merge_status": ci_status.merge_conflict_info})
+            else:
+                _handle_merge_conflict_status(ci_status)
             return
 
         # Early return for no failures
         if not ci_status.has_failures:
-            click.echo(f"✅ No failing CI jobs found for {target_description}!")
+            click.echo(f"✅ No failing CI jobs found for {target_description}!", err=as_json)
             return
 
         # Display failed jobs
-        _display_failed_jobs_status(fetcher, owner, repo_name, ci_status)
+        _display_failed_jobs_status(fetcher, owner, repo_name, ci_status, as_json)
 
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
@@ -213,7 +269,7 @@ def logs(repo, branch, commit, pr, verbose, raw, job_id, show_groups, step_filte
     """Show error logs for failed CI jobs."""
     try:
         validate_target_options(branch, commit, pr)
-        fetcher = GitHubCIFetcher()
+        fetcher = _create_fetcher()
         owner, repo_name, commit_sha, target_description, pr_number = get_target_info(
             fetcher, repo, branch, commit, pr, verbose
         )
@@ -249,18 +305,19 @@ def logs(repo, branch, commit, pr, verbose, raw, job_id, show_groups, step_filte
 @click.option("--until-complete", is_flag=True, help="Wait until all workflows complete")
 @click.option("--until-fail", is_flag=True, help="Stop on first failure")
 @click.option("--retry", type=int, metavar="COUNT", help="Auto-retry failed jobs up to COUNT times")
-def watch(repo, branch, commit, pr, verbose, until_complete, until_fail, retry):
+@json_option
+def watch(repo, branch, commit, pr, verbose, until_complete, until_fail, retry, as_json):
     """Watch CI status with real-time updates."""
     try:
         validate_target_options(branch, commit, pr)
         _validate_watch_options(until_complete, until_fail, retry)
 
-        fetcher = GitHubCIFetcher()
+        fetcher = _create_fetcher()
         owner, repo_name, commit_sha, target_description, pr_number = get_target_info(
-            fetcher, repo, branch, commit, pr, verbose
+            fetcher, repo, branch, commit, pr, verbose, as_json
         )
 
-        _display_watch_header(target_description, commit_sha, retry)
+        _display_watch_header(target_description, commit_sha, retry, as_json)
         _run_watch_loop(
             fetcher,
             owner,
@@ -270,6 +327,7 @@ def watch(repo, branch, commit, pr, verbose, until_complete, until_fail, retry):
             until_complete,
             until_fail,
             retry,
+            as_json,
         )
 
     except ValueError as e:
@@ -298,27 +356,44 @@ def _validate_watch_options(until_complete, until_fail, retry):
         sys.exit(1)
 
 
-def _display_watch_header(target_description, commit_sha, retry):
+def _display_watch_header(target_description, commit_sha, retry, as_json=False):
     """Display header information for watch command."""
-    click.echo(f"🔄 Watching CI status for {target_description}...")
-    click.echo(f"📋 Commit: {commit_sha}")
+    click.echo(f"🔄 Watching CI status for {target_description}...", err=as_json)
+    click.echo(f"📋 Commit: {commit_sha}", err=as_json)
     if retry:
-        click.echo(f"🔁 Will retry failed jobs up to {retry} time(s)")
-    click.echo("Press Ctrl+C to stop watching\\n")
+        click.echo(f"🔁 Will retry failed jobs up to {retry} time(s)", err=as_json)
+    click.echo("Press Ctrl+C to stop watching\\n", err=as_json)
 
 
 def _run_watch_loop(
-    fetcher, owner, repo_name, commit_sha, target_description, until_complete, until_fail, retry
+    fetcher,
+    owner,
+    repo_name,
+    commit_sha,
+    target_description,
+    until_complete,
+    until_fail,
+    retry,
+    as_json=False,
 ):
-    """Run the main watch polling loop."""
-    poll_interval = POLL_INTERVAL_SECONDS
-    max_polls = MAX_POLLS
+    """Run the main watch polling loop.
+
+    The interval starts short and doubles while no workflow run changes, so long
+    builds are polled far less often without delaying the reaction to changes.
+    In JSON mode each poll is printed as one NDJSON line and every progress
+    message goes to stderr.
+    """
+    poll_interval = MIN_POLL_INTERVAL_SECONDS
+    last_updated = None
+    waited = 0
     poll_count = 0
+    tick = 0
+    last_displayed = None
     retry_count = 0
     initial_no_runs_wait_done = False
 
     try:
-        while poll_count < max_polls:
+        while True:
             # Get status for this poll cycle
             watch_result = watch_ci_status(
                 fetcher,
@@ -333,7 +408,7 @@ def _run_watch_loop(
 
             # Handle initial wait for workflow runs to appear
             if watch_result["status"] == "no_runs" and not initial_no_runs_wait_done:
-                click.echo("⏳ Waiting 10 seconds for workflow runs to appear...")
+                click.echo("⏳ Waiting 10 seconds for workflow runs to appear...", err=as_json)
                 time.sleep(10)
                 initial_no_runs_wait_done = True
 
@@ -350,40 +425,69 @@ def _run_watch_loop(
                 )
 
             # Display current status
-            _display_watch_status(watch_result)
+            tick += 1
+            if as_json:
+                _echo_json(
+                    {
+                        "tick": tick,
+                        "status": watch_result["status"],
+                        "runs": watch_result.get("workflows", []),
+                    }
+                )
+            elif (watch_result["status"], watch_result.get("workflows")) != last_displayed:
+                # Unchanged polls (mostly ETag 304s) would only repeat the previous block
+                _display_watch_status(watch_result)
+                last_displayed = (watch_result["status"], watch_result.get("workflows"))
 
             # Handle watch result with early returns
             if not watch_result["continue_watching"]:
-                _handle_watch_completion(watch_result, retry, retry_count)
+                _handle_watch_completion(watch_result, retry, retry_count, as_json)
                 return
 
             if watch_result["status"] == "retry_needed" and retry and retry_count < retry:
                 retry_count += 1
-                click.echo(f"\\n🔁 Retrying failed jobs (attempt {retry_count}/{retry})...")
+                click.echo(
+                    f"\\n🔁 Retrying failed jobs (attempt {retry_count}/{retry})...", err=as_json
+                )
 
                 # Retry failed runs
                 retry_results = retry_failed_workflows(
                     fetcher, owner, repo_name, watch_result["failed_runs"]
                 )
-                _display_retry_results(retry_results)
+                _display_retry_results(retry_results, as_json)
 
                 # Reset polling for the retry
+                poll_interval = MIN_POLL_INTERVAL_SECONDS
+                last_updated = None
+                waited = 0
                 poll_count = 0
                 time.sleep(RETRY_SLEEP_SECONDS)  # Wait longer before starting to poll again
                 continue
 
-            # Continue polling
-            if poll_count < max_polls - 1:  # Don't sleep on last iteration
-                click.echo(f"\\n⏰ Waiting {poll_interval}s... (poll {poll_count + 1}/{max_polls})")
-                time.sleep(poll_interval)
+            if waited >= WATCH_TIMEOUT_SECONDS:
+                break
 
+            # Poll again soon after a change; back off while the runs sit unchanged
+            if watch_result.get("last_updated") != last_updated:
+                last_updated = watch_result.get("last_updated")
+                poll_interval = MIN_POLL_INTERVAL_SECONDS
+            elif poll_count > 0:
+                poll_interval = min(poll_interval * 2, MAX_POLL_INTERVAL_SECONDS)
+
+            # Jitter spreads out watchers started together (e.g. one per matrix job), which
+            # GitHub's secondary rate limits would otherwise see as bursts
+            jitter = random.uniform(0, POLL_JITTER_SECONDS)
+            sleep_seconds = min(poll_interval + jitter, WATCH_TIMEOUT_SECONDS - waited)
             poll_count += 1
+            click.echo(f"\\n⏰ Waiting {sleep_seconds:.0f}s... (poll {poll_count})", err=as_json)
+            time.sleep(sleep_seconds)
+            waited += sleep_seconds
 
-        click.echo("\\n⏰ Polling timeout reached")
+        click.echo("\\n⏰ Polling timeout reached", err=as_json)
         sys.exit(1)
 
     except KeyboardInterrupt:
-        click.echo("\\n👋 Watching stopped by user")
+        click.echo("\\n👋 Watching stopped by user", err=as_json)
         sys.exit(0)
 
 
@@ -394,39 +498,42 @@ def _display_watch_status(watch_result):
         return
 
     workflows = watch_result.get("workflows", [])
-    click.echo(f"📊 Found {len(workflows)} workflow run(s):")
-
-    for workflow in workflows:
-        click.echo(
-            f"  {workflow['emoji']} {workflow['name']} ({workflow['status']}) - {workflow['duration']}"
-        )
+    # One write per poll keeps the block together in the terminal
+    lines = [f"📊 Found {len(workflows)} workflow run(s):"]
+    lines.extend(
+        f"  {workflow['emoji']} {workflow['name']} ({workflow['status']}) - {workflow['duration']}"
+        for workflow in workflows
+    )
+    click.echo("\n".join(lines))
 
 
-def _handle_watch_completion(watch_result, retry, retry_count):
+def _handle_watch_completion(watch_result, retry, retry_count, as_json=False):
     """Handle watch completion with appropriate exit codes."""
     status = watch_result["status"]
 
     if status == "stop_on_failure":
-        click.echo("\\n💥 Stopping on first failure!")
+        click.echo("\\n💥 Stopping on first failure!", err=as_json)
         sys.exit(1)
     elif status == "failed":
         if retry and retry_count >= retry:
-            click.echo(f"\\n💥 Max retries ({retry}) reached. Some workflows still failed!")
+            click.echo(
+                f"\\n💥 Max retries ({retry}) reached. Some workflows still failed!", err=as_json
+            )
         else:
-            click.echo("\\n💥 Some workflows failed!")
+            click.echo("\\n💥 Some workflows failed!", err=as_json)
         sys.exit(1)
     elif status == "success":
-        click.echo("\\n🎉 All workflows completed successfully!")
+        click.echo("\\n🎉 All workflows completed successfully!", err=as_json)
         sys.exit(0)
 
 
-def _display_retry_results(retry_results):
+def _display_retry_results(retry_results, as_json=False):
     """Display results of retry attempts."""
     for run_id, success in retry_results.items():
         if success:
-            click.echo(f"  ✅ Restarted failed jobs in run {run_id}")
+            click.echo(f"  ✅ Restarted failed jobs in run {run_id}", err=as_json)
         else:
-            click.echo(f"  ❌ Failed to restart jobs in run {run_id}")
+            click.echo(f"  ❌ Failed to restart jobs in run {run_id}", err=as_json)
 
 
 def _display_job_logs(log_result):
@@ -447,12 +554,16 @@ def _display_specific_job_logs(log_result):
     logs = log_result["logs"]
 
     click.echo(f"📄 Raw logs for job ID {job_info.get('id', 'Unknown')}:")
-    click.echo("=" * 80)
+    click.echo(_EQUALS_80)
     click.echo(f"Job: {job_info.get('name', 'Unknown')}")
     click.echo(f"Status: {job_info.get('conclusion', 'unknown')}")
     click.echo(f"URL: {job_info.get('html_url', '')}")
-    click.echo("-" * 80)
-    click.echo(logs)
+    click.echo(_DASHES_80)
+
+    # Print chunks as they stream in rather than waiting for the whole log
+    for chunk in logs:
+        click.echo(chunk, nl=False)
+    click.echo()
 
 
 def _display_raw_logs(log_result):
@@ -472,11 +583,11 @@ def _display_raw_logs(log_result):
         job_name = job.get("name", "Unknown")
         job_id = job.get("id")
 
-        click.echo(f"{'=' * 80}")
+        click.echo(_EQUALS_80)
         click.echo(f"RAW LOGS #{i}: {job_name} (ID: {job_id})")
-        click.echo(f"{'=' * 80}")
+        click.echo(_EQUALS_80)
         click.echo(logs)
-        click.echo("\\n" + "=" * 80 + "\\n")
+        click.echo(f"\\n{_EQUALS_80}\\n")
 
 
 def _display_filtered_logs(log_result):
@@ -494,7 +605,7 @@ def _display_filtered_logs(log_result):
     # Show group summary and step status at the top
     if show_groups and groups:
         click.echo(f"📋 Available log groups in {target_description}:")
-        click.echo("=" * 60)
+        click.echo(_EQUALS_60)
 
         # Show groups with nesting
         _display_groups_with_nesting(groups)
@@ -516,7 +627,7 @@ def _display_filtered_logs(log_result):
             if filters.get("group_filter"):
                 click.echo(f"  • Group filter: '{filters['group_filter']}'")
 
-        click.echo("=" * 60)
+        click.echo(_EQUALS_60)
         click.echo("💡 Use --step-filter or --group-filter to focus on specific sections")
         click.echo('💡 Example: --group-filter="mise run test"')
         click.echo("💡 Use --show-groups=false to hide this summary")
@@ -526,16 +637,16 @@ def _display_filtered_logs(log_result):
     click.echo()
 
     for i, job_log in enumerate(failed_jobs, 1):
-        click.echo(f"{'=' * 60}")
+        click.echo(_EQUALS_60)
         click.echo(f"LOGS #{i}: {job_log['name']}")
-        click.echo(f"{'=' * 60}")
+        click.echo(_EQUALS_60)
 
         if job_log.get("error"):
             click.echo(job_log["error"])
         elif job_log["step_logs"]:
             for step_name, step_log in job_log["step_logs"].items():
                 click.echo(f"\\n📄 Logs for Failed Step: {step_name}")
-                click.echo("-" * 50)
+                click.echo(_DASHES_50)
                 if step_log.strip():
                     click.echo(step_log)
                 else:
@@ -548,25 +659,38 @@ def _display_filtered_logs(log_result):
 
 def _display_groups_with_nesting(groups):
     """Display groups with proper nesting indentation."""
-    step_groups = [g for g in groups if g["type"] == "step"]
-    setup_groups = [g for g in groups if g["type"] == "setup"]
+    # Partition in one pass over the groups
+    groups_by_type = {"setup": [], "step": []}
+    for group in groups:
+        if group["type"] in groups_by_type:
+            groups_by_type[group["type"]].append(group)
+    setup_groups = groups_by_type["setup"]
+    step_groups = groups_by_type["step"]
+
+    # Build each section and write it with one echo; logs can have hundreds of groups
+    lines = []
 
     if setup_groups:
-        click.echo("🔧 Setup/System Groups:")
-        for group in setup_groups:
-            indent = "  " + "  " * group.get("nesting_level", 0)
-            click.echo(f"{indent}• {group['name']} (line {group['line_number']})")
+        lines.append("🔧 Setup/System Groups:")
+        lines.extend(_format_group_line(group) for group in setup_groups)
 
     if step_groups:
-        click.echo("🏃 Step Groups:")
-        for group in step_groups:
-            indent = "  " + "  " * group.get("nesting_level", 0)
-            click.echo(f"{indent}• {group['name']} (line {group['line_number']})")
+        lines.append("🏃 Step Groups:")
+        lines.extend(_format_group_line(group) for group in step_groups)
+
+    if lines:
+        click.echo("\n".join(lines))
+
+
+def _format_group_line(group):
+    """Format one log group as an indented bullet."""
+    indent = "  " + "  " * group.get("nesting_level", 0)
+    return f"{indent}• {group['name']} (line {group['line_number']})"
 
 
 def _display_step_status_summary(step_status):
     """Display deterministic step status summary."""
-    click.echo("📊 Step Status Summary:")
+    lines = ["📊 Step Status Summary:"]
 
     success_steps = []
     failed_steps = []
@@ -581,17 +705,18 @@ def _display_step_status_summary(step_status):
             other_steps.append((step_name, status["conclusion"]))
 
     if success_steps:
-        click.echo(f"  ✅ {len(success_steps)} successful steps")
+        lines.append(f"  ✅ {len(success_steps)} successful steps")
 
     if failed_steps:
-        click.echo(f"  ❌ {len(failed_steps)} failed steps:")
-        for step in failed_steps:
-            click.echo(f"    • {step}")
+        lines.append(f"  ❌ {len(failed_steps)} failed steps:")
+        lines.extend(f"    • {step}" for step in failed_steps)
 
     if other_steps:
         for step_name, conclusion in other_steps:
-            icon = "⏭️" if conclusion == "skipped" else "🚫" if conclusion == "cancelled" else "❓"
-            click.echo(f"  {icon} {step_name} ({conclusion})")
+            icon = _STEP_CONCLUSION_ICONS.get(conclusion, "❓")
+            lines.append(f"  {icon} {step_name} ({conclusion})")
+
+    click.echo("\n".join(lines))
 
 
 def _has_merge_conflicts(merge_info):
@@ -662,26 +787,51 @@ def _handle_merge_conflict_status(ci_status):
         return
 
 
-def _display_failed_jobs_status(fetcher, owner, repo_name, ci_status):
-    """Display failed jobs status with step details."""
+def _display_failed_jobs_status(fetcher, owner, repo_name, ci_status, as_json=False):
+    """Display failed jobs status with step details, or one NDJSON line per job."""
     click.echo(
-        f"❌ Found {len(ci_status.failed_check_runs)} failing CI job(s) for {ci_status.target_description}:"
+        f"❌ Found {len(ci_status.failed_check_runs)} failing CI job(s) for {ci_status.target_description}:",
+        err=as_json,
     )
-    click.echo()
+    if not as_json:
+        click.echo()
+
+    # Fetch details for every failed job concurrently, then print them in the original order
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        all_job_details = list(
+            executor.map(
+                lambda check_run: get_job_details_for_status(fetcher, owner, repo_name, check_run),
+                ci_status.failed_check_runs,
+            )
+        )
 
-    for i, check_run in enumerate(ci_status.failed_check_runs, 1):
+    for i, (check_run, job_details) in enumerate(
+        zip(ci_status.failed_check_runs, all_job_details, strict=True), 1
+    ):
         name = check_run.get("name", "Unknown Job")
         conclusion = check_run.get("conclusion", "unknown")
         html_url = check_run.get("html_url", "")
 
-        click.echo(f"{'=' * 60}")
+        if as_json:
+            failed_steps = job_details.failed_steps if job_details else []
+            _echo_json(
+                {
+                    "job": name,
+                    "conclusion": conclusion,
+                    "url": html_url,
+                    "steps": [
+                        {"number": step.number, "name": step.name, "duration": step.duration}
+                        for step in failed_steps
+                    ],
+                }
+            )
+            continue
+
+        click.echo(_EQUALS_60)
         click.echo(f"FAILED JOB #{i}: {name}")
         click.echo(f"Status: {conclusion}")
         click.echo(f"URL: {html_url}")
-        click.echo(f"{'=' * 60}")
-
-        # Get detailed job information
-        job_details = get_job_details_for_status(fetcher, owner, repo_name, check_run)
+        click.echo(_EQUALS_60)
 
         if not job_details:
             click.echo("Cannot retrieve detailed information for this check run type")
@@ -689,10 +839,13 @@ def _display_failed_jobs_status(fetcher, owner, repo_name, ci_status):
             continue
 
         if job_details.failed_steps:
-            click.echo(f"\\n📋 Failed Steps in {job_details.name}:")
-            for step in job_details.failed_steps:
-                click.echo(f"  ❌ Step {step.number}: {step.name} (took {step.duration})")
-            click.echo()
+            # One write for the whole block; matrix failures can list dozens of steps
+            lines = [f"\\n📋 Failed Steps in {job_details.name}:"]
+            lines.extend(
+                f"  ❌ Step {step.number}: {step.name} (took {step.duration})"
+                for step in job_details.failed_steps
+            )
+            click.echo("\n".join(lines) + "\n")
         else:
             click.echo("Cannot retrieve detailed information for this check run type")
             click.echo()
@@ -4,9 +4,13 @@ This module centralizes all magic numbers and configuration values
 to improve maintainability and make the codebase more configurable.
 """
 
+import re
+
 # Polling and timing constants
-POLL_INTERVAL_SECONDS = 10
-MAX_POLLS = 120  # 20 minutes total (120 * 10 seconds)
+MIN_POLL_INTERVAL_SECONDS = 5  # Interval after any workflow run changed
+MAX_POLL_INTERVAL_SECONDS = 60  # Cap for the doubling interval while nothing changes
+POLL_JITTER_SECONDS = 2  # Random extra wait so concurrent watchers don't poll in lockstep
+WATCH_TIMEOUT_SECONDS = 1200  # 20 minutes of polling before watch gives up
 RETRY_SLEEP_SECONDS = 30
 
 # Log parsing constants
@@ -14,9 +18,19 @@ POST_ENDGROUP_LINES = 10  # Lines to capture after ##[endgroup]
 FALLBACK_LOG_LINES = 10  # Lines to show when step parsing fails
 TIMESTAMP_TOLERANCE_SECONDS = 1.0  # Tolerance for timestamp matching
 
+# Network concurrency
+MAX_CONCURRENT_REQUESTS = 10  # Upper bound on parallel GitHub API requests
+REQUEST_TIMEOUT_SECONDS = 30  # Connect/read timeout for a single HTTP request
+LOG_CHUNK_SIZE = 65536  # Bytes read per chunk when streaming job logs
+WORKFLOW_RUNS_FRESH_SECONDS = 30  # Reuse a run listing confirmed this recently without a request
+CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60  # Cache entries not refreshed for a week are pruned
+
 # GitHub API pagination
 DEFAULT_PER_PAGE = 10
-LARGE_PER_PAGE = 50
+MAX_PER_PAGE = 100  # Largest page size the REST API accepts
+
+# App ID of GitHub Actions, for narrowing check runs to Actions jobs
+GITHUB_ACTIONS_APP_ID = 15368
 
 # Git/SHA constants
 SHORT_SHA_LENGTH = 8
@@ -24,7 +38,6 @@ FULL_SHA_LENGTH = 40
 
 # Log parsing thresholds
 MIN_WORD_LENGTH_SEMANTIC = 2  # Minimum word length for semantic matching
-MIN_WORD_LENGTH_PARTIAL = 3  # Minimum word length for partial matching
 
-# Current year for timestamp filtering (should be made dynamic in future)
-CURRENT_YEAR_PREFIX = "2025-"
+# Timestamp prefix GitHub adds to every log line (e.g. 2025-07-16T03:13:13.5152643Z)
+TIMESTAMP_PREFIX_RE = re.compile(r"\d{4}-\d{2}-\d{2}T")
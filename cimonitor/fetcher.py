@@ -1,51 +1,254 @@
 """Core GitHub CI fetching functionality."""
 
+import codecs
+import hashlib
+import json
 import os
-from typing import Any
-from urllib.parse import urlparse
+import re
+import time
+from collections.abc import Callable, Iterator
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
 
 import requests
-from git import Repo
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import ResponseCache
+from .constants import (
+    DEFAULT_PER_PAGE,
+    FULL_SHA_LENGTH,
+    GITHUB_ACTIONS_APP_ID,
+    LOG_CHUNK_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_PER_PAGE,
+    REQUEST_TIMEOUT_SECONDS,
+    SHORT_SHA_LENGTH,
+    WORKFLOW_RUNS_FRESH_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from git import Repo
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Owner and repository of an SCP-style SSH remote (git@github.com:owner/repo.git) or
+# a URL remote (https://github.com/owner/repo.git, ssh://git@github.com/owner/repo)
+_REMOTE_URL_RE = re.compile(
+    r"^(?:[\w.-]+@[\w.-]+:|[a-z][a-z0-9+.-]*://[^/]+/)([^/]+)/([^/]+?)(?:\.git)?/?$"
+)
+
+# The workflow run fields watch and the REST fallback read. Runs are projected to these
+# so the rest of each payload (commit, actor, repository objects) isn't kept around.
+_WORKFLOW_RUN_FIELDS = (
+    "id",
+    "name",
+    "status",
+    "conclusion",
+    "created_at",
+    "updated_at",
+    "html_url",
+)
+
+# Failed check runs for a commit, with every step, in a single request
+FAILURE_TREE_QUERY = """
+query($owner: String!, $repo: String!, $oid: GitObjectID!) {
+  repository(owner: $owner, name: $repo) {
+    object(oid: $oid) {
+      ... on Commit {
+        checkSuites(first: 20) {
+          pageInfo { hasNextPage }
+          nodes {
+            app { slug }
+            checkRuns(first: 50, filterBy: {checkType: LATEST, conclusions: [FAILURE]}) {
+              pageInfo { hasNextPage }
+              nodes {
+                databaseId
+                name
+                conclusion
+                url
+                detailsUrl
+                steps(first: 50) {
+                  pageInfo { hasNextPage }
+                  nodes { name number status conclusion startedAt completedAt }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _has_next_page(connection: dict[str, Any]) -> bool:
+    """Whether a GraphQL connection was truncated at its page size."""
+    return bool((connection.get("pageInfo") or {}).get("hasNextPage"))
+
 
-from .constants import DEFAULT_PER_PAGE, FULL_SHA_LENGTH, LARGE_PER_PAGE, SHORT_SHA_LENGTH
+def _user_agent() -> str:
+    """Identify cimonitor to GitHub, as the API docs ask clients to."""
+    try:
+        return f"cimonitor/{version('cimonitor')}"
+    except PackageNotFoundError:
+        # Running from a source checkout that isn't installed
+        return "cimonitor"
 
 
 class GitHubCIFetcher:
-    def __init__(self, github_token: str | None = None):
+    def __init__(self, github_token: str | None = None, cache: ResponseCache | None = None):
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
         if not self.github_token:
             raise ValueError("GitHub token is required. Set GITHUB_TOKEN environment variable.")
 
         self.headers = {
             "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github.v3+json",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": _user_agent(),
         }
+        self.cache = cache
+        # Cache entries are partitioned by token so no token reads another's responses
+        self._cache_scope = hashlib.sha256(self.github_token.encode()).hexdigest()
+
+        # Reuse keep-alive connections instead of a TCP+TLS handshake per request.
+        # The pool is sized so concurrent fetches don't discard connections.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10, pool_maxsize=MAX_CONCURRENT_REQUESTS, max_retries=retry
+            ),
+        )
+
+        # Request key -> (ETag, parsed body) for conditional GETs within this process
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+        # Job ID -> logs already downloaded by this fetcher
+        self._log_cache: dict[int, str] = {}
+        self._repo: Repo | None = None
+        self._repo_info: tuple[str, str] | None = None
+
+    @property
+    def repo(self) -> "Repo":
+        """The local git repository, opened once on first use."""
+        if self._repo is None:
+            # GitPython is slow to import and only needed without --repo/--commit targets
+            from git import Repo
+
+            self._repo = Repo(".")
+        return self._repo
+
+    def _get_json(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        project: Callable[[Any], Any] | None = None,
+        max_age: float | None = None,
+        reuse_if: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """GET a JSON resource, revalidating cached copies with If-None-Match.
+
+        The body is parsed straight from the response bytes, skipping the
+        intermediate str that response.json() builds. If given, project is
+        applied to the parsed body before it is remembered and returned, so
+        only the projection stays in memory between polls. With max_age, a disk
+        cached response confirmed current within that many seconds is returned
+        without a request, provided reuse_if (if given) accepts the projected
+        body; this only applies to the first request for a URL in the process,
+        so repeated polls always revalidate. Raises
+        requests.RequestException on HTTP errors, like requests itself.
+        """
+        cache_key = f"{url}?{urlencode(params)}" if params else url
+
+        # Responses seen earlier in this process are reused already parsed; the
+        # on-disk cache only needs consulting for the first request per URL.
+        remembered = self._etag_cache.get(cache_key)
+        stored = None
+        if remembered is None and self.cache:
+            stored = self.cache.get_response(self._cache_scope, cache_key)
+            if stored and max_age is not None and time.time() - stored[2] < max_age:
+                data = json.loads(stored[1])
+                if project:
+                    data = project(data)
+                if reuse_if is None or reuse_if(data):
+                    self._etag_cache[cache_key] = (stored[0], data)
+                    return data
+
+        etag = remembered[0] if remembered else stored[0] if stored else None
+        headers = {"If-None-Match": etag} if etag else None
+        response = self.session.get(
+            url, params=params, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS
+        )
+
+        # 304 responses don't count against the rate limit and carry no body
+        if etag and response.status_code == 304:
+            if max_age is not None and self.cache:
+                self.cache.touch_response(self._cache_scope, cache_key)
+            if remembered:
+                return remembered[1]
+            data = json.loads(stored[1])
+            if project:
+                data = project(data)
+            self._etag_cache[cache_key] = (etag, data)
+            return data
+
+        response.raise_for_status()
+        data = json.loads(response.content)
+        if project:
+            data = project(data)
+
+        new_etag = response.headers.get("ETag")
+        if new_etag:
+            self._etag_cache[cache_key] = (new_etag, data)
+            if self.cache:
+                self.cache.store_response(
+                    self._cache_scope, cache_key, new_etag, response.content.decode("utf-8")
+                )
+
+        return data
+
+    def _get_all_pages(self, url: str, params: dict[str, Any], key: str) -> list[Any]:
+        """GET every page of a list endpoint that reports its total_count.
+
+        Pages are requested until the items under key add up to total_count or a
+        page comes back empty. Each page goes through _get_json, so unchanged
+        pages are revalidated rather than downloaded again.
+        """
+        items: list[Any] = []
+        page = 1
+        while True:
+            data = self._get_json(url, {**params, "page": page})
+            page_items = data.get(key, [])
+            items.extend(page_items)
+            if not page_items or len(items) >= data.get("total_count", 0):
+                return items
+            page += 1
 
     def get_repo_info(self) -> tuple[str, str]:
         """Get owner and repo name from git remote origin URL."""
-        try:
-            repo = Repo(".")
-            origin_url = repo.remotes.origin.url
+        if self._repo_info:
+            return self._repo_info
 
-            if origin_url.startswith("git@"):
-                # Handle SSH format: git@github.com:owner/repo.git
-                parts = origin_url.replace("git@github.com:", "").replace(".git", "").split("/")
-            else:
-                # Handle HTTPS format: https://github.com/owner/repo.git
-                parsed_url = urlparse(origin_url)
-                parts = parsed_url.path.strip("/").replace(".git", "").split("/")
+        try:
+            origin_url = self.repo.remotes.origin.url
 
-            if len(parts) >= 2:
-                return parts[0], parts[1]
-            else:
+            match = _REMOTE_URL_RE.match(origin_url)
+            if not match:
                 raise ValueError(f"Could not parse repository info from: {origin_url}")
+
+            self._repo_info = (match[1], match[2])
+            return self._repo_info
         except Exception as e:
             raise ValueError(f"Failed to get repository info: {e}")
 
     def get_current_branch_and_commit(self) -> tuple[str, str]:
         """Get current branch name and latest commit SHA."""
         try:
-            repo = Repo(".")
+            repo = self.repo
 
             if repo.head.is_detached:
                 # If in detached HEAD state, use commit SHA
@@ -65,53 +268,188 @@ class GitHubCIFetcher:
         params = {"branch": branch, "per_page": DEFAULT_PER_PAGE, "status": "completed"}
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json().get("workflow_runs", [])
+            return self._get_json(url, params, project=self._project_workflow_runs)
         except requests.RequestException as e:
             raise ValueError(f"Failed to fetch workflow runs: {e}")
 
+    @staticmethod
+    def _has_unfinished_runs(workflow_runs: list[dict[str, Any]]) -> bool:
+        """Whether a run listing still awaits runs, so reusing it can't end a watch early.
+
+        A listing where every run completed would be reported as final, and a run
+        re-run or started since it was cached would be missed, so it is revalidated.
+        """
+        return not workflow_runs or any(run.get("status") != "completed" for run in workflow_runs)
+
+    @staticmethod
+    def _project_workflow_runs(payload: dict[str, Any]) -> list[dict[str, Any]]:
+        """Keep only the workflow run fields cimonitor reads."""
+        return [
+            {field: run.get(field) for field in _WORKFLOW_RUN_FIELDS}
+            for run in payload.get("workflow_runs", [])
+        ]
+
     def get_job_logs(self, owner: str, repo: str, job_id: int) -> str:
-        """Get logs for a specific job."""
+        """Get logs for a specific job.
+
+        Logs are only requested for failed, hence completed, jobs, and logs of
+        completed jobs never change, so they are cached by job ID. Within one
+        fetcher, each job's logs are downloaded at most once.
+        """
+        if job_id in self._log_cache:
+            return self._log_cache[job_id]
+
+        if self.cache:
+            cached_logs = self.cache.get_job_logs(self._cache_scope, job_id)
+            if cached_logs is not None:
+                return cached_logs
+
         url = f"https://api.github.com/repos/{owner}/{repo}/actions/jobs/{job_id}/logs"
 
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.text
+            response = self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT_SECONDS)
+            try:
+                response.raise_for_status()
+                logs = self._read_text(response)
+            finally:
+                response.close()
+            self._log_cache[job_id] = logs
+            if self.cache:
+                self.cache.store_job_logs(self._cache_scope, job_id, logs)
+            return logs
         except requests.RequestException as e:
             return f"Failed to fetch logs for job {job_id}: {e}"
 
+    def iter_job_logs(self, owner: str, repo: str, job_id: int) -> Iterator[str]:
+        """Yield a job's logs as text chunks while they download.
+
+        Unlike get_job_logs, the logs are never held in memory as a whole, so they
+        are not written to the cache either (cached logs are still served from it).
+        Raises ValueError if the logs cannot be fetched.
+        """
+        if job_id in self._log_cache:
+            yield self._log_cache[job_id]
+            return
+
+        if self.cache:
+            cached_logs = self.cache.get_job_logs(self._cache_scope, job_id)
+            if cached_logs is not None:
+                yield cached_logs
+                return
+
+        url = f"https://api.github.com/repos/{owner}/{repo}/actions/jobs/{job_id}/logs"
+
+        try:
+            response = self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT_SECONDS)
+            try:
+                response.raise_for_status()
+                yield from self._iter_text(response)
+            finally:
+                response.close()
+        except requests.RequestException as e:
+            raise ValueError(f"Failed to fetch logs for job {job_id}: {e}")
+
+    @staticmethod
+    def _iter_text(response: requests.Response) -> Iterator[str]:
+        """Decode a streamed response body chunk by chunk.
+
+        Skips requests' charset sniffing over multi-MB log bodies, and never holds
+        the raw bytes and the decoded text in memory at the same time.
+        """
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        for chunk in response.iter_content(chunk_size=LOG_CHUNK_SIZE):
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    @staticmethod
+    def _read_text(response: requests.Response) -> str:
+        """Decode a whole streamed response body."""
+        return "".join(GitHubCIFetcher._iter_text(response))
+
     def get_workflow_jobs(self, owner: str, repo: str, run_id: int) -> list[dict[str, Any]]:
-        """Get jobs for a specific workflow run."""
+        """Get every job of a specific workflow run, 100 per request."""
         url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs/{run_id}/jobs"
 
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json().get("jobs", [])
+            return self._get_all_pages(url, {"per_page": MAX_PER_PAGE}, "jobs")
         except requests.RequestException as e:
             raise ValueError(f"Failed to fetch jobs for run {run_id}: {e}")
 
-    def find_failed_jobs_in_latest_run(
-        self, owner: str, repo: str, commit_sha: str
-    ) -> list[dict[str, Any]]:
-        """Find failed jobs in the latest workflow run for the given commit."""
-        url = f"https://api.github.com/repos/{owner}/{repo}/commits/{commit_sha}/check-runs"
-
+    def _post_graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run a GraphQL query and return its data, raising ValueError on failure."""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.post(
+                GRAPHQL_URL,
+                json={"query": query, "variables": variables},
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
             response.raise_for_status()
-            check_runs = response.json().get("check_runs", [])
+            payload = json.loads(response.content)
+        except requests.RequestException as e:
+            raise ValueError(f"GraphQL request failed: {e}")
 
-            failed_jobs = []
-            for check_run in check_runs:
-                if check_run.get("conclusion") == "failure":
-                    failed_jobs.append(check_run)
+        if payload.get("errors"):
+            messages = "; ".join(
+                error.get("message", "unknown error") for error in payload["errors"]
+            )
+            raise ValueError(f"GraphQL query failed: {messages}")
 
-            return failed_jobs
-        except requests.RequestException as e:
-            raise ValueError(f"Failed to fetch check runs: {e}")
+        return payload.get("data") or {}
+
+    def fetch_failure_tree(self, owner: str, repo: str, commit_sha: str) -> list[dict[str, Any]]:
+        """Get failed check runs for a commit, including their steps, in one GraphQL request.
+
+        Replaces a check-runs request plus one jobs request per workflow run. Check
+        runs are returned in the REST API's shape; those created by GitHub Actions
+        also carry their "steps", and their "id" is the job ID used for logs. Only
+        the latest attempt of each check is returned, as the REST endpoint does.
+
+        Raises ValueError if the commit has more check suites or failed check runs
+        than one page holds, so callers can fall back to the REST API. A run with
+        more steps than one page holds is returned without "steps".
+        """
+        data = self._post_graphql(
+            FAILURE_TREE_QUERY, {"owner": owner, "repo": repo, "oid": commit_sha}
+        )
+        commit = (data.get("repository") or {}).get("object") or {}
+
+        check_suites = commit.get("checkSuites", {})
+        if _has_next_page(check_suites):
+            raise ValueError(f"Too many check suites on {commit_sha} for one GraphQL page")
+
+        failed_check_runs = []
+        for suite in check_suites.get("nodes", []):
+            is_actions = (suite.get("app") or {}).get("slug") == "github-actions"
+            check_runs = suite.get("checkRuns", {})
+            if _has_next_page(check_runs):
+                raise ValueError(f"Too many failed check runs on {commit_sha} for one GraphQL page")
+            for run in check_runs.get("nodes", []):
+                check_run = {
+                    "id": run.get("databaseId"),
+                    "name": run.get("name"),
+                    "conclusion": (run.get("conclusion") or "").lower() or None,
+                    "html_url": run.get("detailsUrl") if is_actions else run.get("url"),
+                }
+                # Truncated steps would hide failures; without them callers fetch the job
+                if is_actions and not _has_next_page(run.get("steps", {})):
+                    check_run["steps"] = [
+                        {
+                            "name": step.get("name"),
+                            "number": step.get("number"),
+                            "status": (step.get("status") or "").lower() or None,
+                            "conclusion": (step.get("conclusion") or "").lower() or None,
+                            "started_at": step.get("startedAt"),
+                            "completed_at": step.get("completedAt"),
+                        }
+                        for step in run.get("steps", {}).get("nodes", [])
+                    ]
+                failed_check_runs.append(check_run)
+
+        return failed_check_runs
 
     def get_failed_steps(self, job: dict[str, Any]) -> list[dict[str, Any]]:
         """Extract failed steps from a job."""
@@ -137,39 +475,36 @@ class GitHubCIFetcher:
         url = f"https://api.github.com/repos/{owner}/{repo}/actions/jobs/{job_id}"
 
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(url)
         except requests.RequestException as e:
             raise ValueError(f"Failed to fetch job {job_id}: {e}")
 
     def get_all_jobs_for_commit(
-        self, owner: str, repo: str, commit_sha: str
+        self, owner: str, repo: str, commit_sha: str, conclusion_filter: str | None = None
     ) -> list[dict[str, Any]]:
-        """Get all jobs (failed and successful) for a specific commit."""
-        # First get all workflow runs for this commit
-        url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs"
-        params = {"head_sha": commit_sha, "per_page": LARGE_PER_PAGE}
+        """Get the GitHub Actions jobs for a commit, optionally only those with a conclusion.
 
-        all_jobs = []
+        Uses the commit's completed check runs, a page of 100 per request, instead of
+        listing workflow runs and then each run's jobs. An Actions check run's ID is
+        its job ID.
+        """
+        url = f"https://api.github.com/repos/{owner}/{repo}/commits/{commit_sha}/check-runs"
+        params = {
+            "filter": "latest",
+            "status": "completed",
+            "app_id": GITHUB_ACTIONS_APP_ID,
+            "per_page": MAX_PER_PAGE,
+        }
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            workflow_runs = response.json().get("workflow_runs", [])
-
-            # Get jobs for each workflow run
-            for run in workflow_runs:
-                run_id = run["id"]
-                jobs = self.get_workflow_jobs(owner, repo, run_id)
-                for job in jobs:
-                    job["run_id"] = run_id  # Add run_id for reference
-                all_jobs.extend(jobs)
-
-            return all_jobs
+            check_runs = self._get_all_pages(url, params, "check_runs")
         except requests.RequestException as e:
             raise ValueError(f"Failed to fetch jobs for commit {commit_sha}: {e}")
 
+        if conclusion_filter is None:
+            return check_runs
+        return [run for run in check_runs if run.get("conclusion") == conclusion_filter]
+
     def resolve_commit_sha(self, owner: str, repo: str, commit_ref: str) -> str:
         """Resolve a commit reference (SHA, branch, tag) to a full SHA."""
         # If it's already a full SHA (40 characters), return as-is
@@ -182,9 +517,7 @@ class GitHubCIFetcher:
         url = f"https://api.github.com/repos/{owner}/{repo}/commits/{commit_ref}"
 
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            commit_data = response.json()
+            commit_data = self._get_json(url)
             return commit_data["sha"]
         except requests.RequestException as e:
             raise ValueError(f"Failed to resolve commit reference '{commit_ref}': {e}")
@@ -194,9 +527,7 @@ class GitHubCIFetcher:
         url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
 
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            pr_data = response.json()
+            pr_data = self._get_json(url)
             return pr_data["head"]["sha"]
         except requests.RequestException as e:
             raise ValueError(f"Failed to get PR {pr_number} head SHA: {e}")
@@ -210,9 +541,7 @@ class GitHubCIFetcher:
         url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
 
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            pr_data = response.json()
+            pr_data = self._get_json(url)
 
             return {
                 "mergeable": pr_data.get("mergeable"),
@@ -230,9 +559,7 @@ class GitHubCIFetcher:
         url = f"https://api.github.com/repos/{owner}/{repo}/branches/{branch_name}"
 
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            branch_data = response.json()
+            branch_data = self._get_json(url)
             return branch_data["commit"]["sha"]
         except requests.RequestException as e:
             raise ValueError(f"Failed to get branch '{branch_name}' head SHA: {e}")
@@ -240,28 +567,53 @@ class GitHubCIFetcher:
     def get_workflow_runs_for_commit(
         self, owner: str, repo: str, commit_sha: str
     ) -> list[dict[str, Any]]:
-        """Get workflow runs for a specific commit."""
+        """Get workflow runs for a specific commit.
+
+        A listing with unfinished runs that was confirmed within the last
+        WORKFLOW_RUNS_FRESH_SECONDS is reused from the disk cache without a request.
+        """
         url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs"
         params = {"head_sha": commit_sha, "per_page": DEFAULT_PER_PAGE}
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json().get("workflow_runs", [])
+            return self._get_json(
+                url,
+                params,
+                project=self._project_workflow_runs,
+                max_age=WORKFLOW_RUNS_FRESH_SECONDS,
+                reuse_if=self._has_unfinished_runs,
+            )
+        except requests.RequestException as e:
+            raise ValueError(f"Failed to fetch workflow runs for commit {commit_sha}: {e}")
+
+    def get_all_workflow_runs_for_commit(
+        self, owner: str, repo: str, commit_sha: str
+    ) -> list[dict[str, Any]]:
+        """Get up to a full page of workflow runs for a commit, always revalidated.
+
+        Unlike get_workflow_runs_for_commit, which serves watch's recent runs,
+        this lists as many runs as one request allows and never reuses a cached
+        copy without asking GitHub, so failures are read from the current state.
+        """
+        url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs"
+        params = {"head_sha": commit_sha, "per_page": MAX_PER_PAGE}
+
+        try:
+            return self._get_json(url, params, project=self._project_workflow_runs)
         except requests.RequestException as e:
             raise ValueError(f"Failed to fetch workflow runs for commit {commit_sha}: {e}")
 
     def rerun_failed_jobs(self, owner: str, repo: str, run_id: int) -> bool:
         """Rerun failed jobs in a workflow run.
 
-        Returns True if the rerun was successful, False otherwise.
+        Returns True if the rerun was successful, False otherwise. Nothing is
+        printed; the CLI reports failures, keeping stdout clean for --json.
         """
         url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs/{run_id}/rerun-failed-jobs"
 
         try:
-            response = requests.post(url, headers=self.headers)
+            response = self.session.post(url, timeout=REQUEST_TIMEOUT_SECONDS)
             response.raise_for_status()
             return True
-        except requests.RequestException as e:
-            print(f"Failed to rerun failed jobs for run {run_id}: {e}")
+        except requests.RequestException:
             return False
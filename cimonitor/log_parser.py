@@ -1,39 +1,59 @@
 """Log parsing functionality for extracting step-specific logs."""
 
+import re
+from collections import deque
+from collections.abc import Iterable
 from typing import Any
 
 from .constants import (
-    CURRENT_YEAR_PREFIX,
-    MIN_WORD_LENGTH_PARTIAL,
+    FALLBACK_LOG_LINES,
     MIN_WORD_LENGTH_SEMANTIC,
     POST_ENDGROUP_LINES,
+    TIMESTAMP_PREFIX_RE,
     TIMESTAMP_TOLERANCE_SECONDS,
 )
 
+# Matches any error keyword or group marker in a single case-insensitive scan
+# ("##[error]" is covered by "error")
+_SHOWN_LINE_RE = re.compile(
+    r"error|failed|failure|exit code|❌|✗|##\[(?:end)?group\]", re.IGNORECASE
+)
+
 
 class LogParser:
     @staticmethod
-    def extract_step_logs(
-        full_logs: str, failed_steps: list[dict[str, Any]], all_steps: list[dict[str, Any]] = None
-    ) -> dict[str, str]:
-        """Extract log sections for specific failed steps using exact name matching only."""
-        step_logs = {}
-        log_lines = full_logs.split("\n")
+    def extract_step_lines(
+        log_lines: list[str], failed_steps: list[dict[str, Any]]
+    ) -> dict[str, list[str]]:
+        """Extract the log lines of each failed step using exact name matching only.
+
+        Takes a job log already split into lines, so callers split it once and share
+        the lines between group parsing, step extraction and error filtering.
+        """
+        step_lines = {}
+
+        # Index the ##[group]Run markers once instead of rescanning the log per step
+        run_groups = LogParser._index_run_groups(log_lines)
 
         for step in failed_steps:
             step_name = step["name"]
 
             # Try exact name matching only - no heuristics
-            step_content = LogParser._extract_step_by_exact_name(log_lines, step_name)
-            if step_content:
-                step_logs[step_name] = step_content
+            lines = LogParser._extract_step_by_exact_name(log_lines, run_groups, step_name)
+            if lines:
+                step_lines[step_name] = lines
+
+        return step_lines
 
-        return step_logs
+    @staticmethod
+    def _index_run_groups(log_lines: list[str]) -> list[tuple[int, str]]:
+        """Return (line index, header text) for every ##[group]Run marker, in log order."""
+        marker = "##[group]Run "
+        return [(i, line.split(marker, 1)[1]) for i, line in enumerate(log_lines) if marker in line]
 
     @staticmethod
-    def parse_log_groups(full_logs: str) -> list[dict[str, str]]:
-        """Parse all ##[group] sections in the logs and return metadata with nesting."""
-        log_lines = full_logs.split("\n")
+    def parse_log_groups_from_lines(log_lines: list[str]) -> list[dict[str, str]]:
+        """Parse all ##[group] sections in the log lines and return metadata with nesting."""
         groups = []
         group_stack = []
 
@@ -123,20 +143,7 @@ class LogParser:
                         time_diff = abs((log_timestamp - step_start).total_seconds())
 
                         if time_diff <= TIMESTAMP_TOLERANCE_SECONDS:
-                            # Extract this section
-                            step_lines = [line]
-
-                            # Capture until endgroup
-                            for j in range(i + 1, len(log_lines)):
-                                next_line = log_lines[j]
-                                step_lines.append(next_line)
-
-                                if "##[endgroup]" in next_line:
-                                    # Continue capturing a few more lines for errors that appear after endgroup
-                                    LogParser._capture_post_endgroup_lines(log_lines, j, step_lines)
-                                    break
-
-                            return "\n".join(step_lines) if step_lines else None
+                            return "\n".join(LogParser._capture_group(log_lines, i))
 
                     except (ValueError, TypeError):
                         # Skip lines with invalid timestamp format
@@ -162,20 +169,7 @@ class LogParser:
                 if "##[group]Run " in line:
                     line_lower = line.lower()
                     if any(keyword in line_lower for keyword in test_keywords):
-                        # Extract this section
-                        step_lines = [line]
-
-                        # Capture until endgroup
-                        for j in range(i + 1, len(log_lines)):
-                            next_line = log_lines[j]
-                            step_lines.append(next_line)
-
-                            if "##[endgroup]" in next_line:
-                                # Continue capturing a few more lines for errors that appear after endgroup
-                                LogParser._capture_post_endgroup_lines(log_lines, j, step_lines)
-                                break
-
-                        return "\n".join(step_lines) if step_lines else None
+                        return "\n".join(LogParser._capture_group(log_lines, i))
 
         # For other step types, try to match by semantic similarity
         # Extract key words from step name (excluding "Run")
@@ -191,20 +185,7 @@ class LogParser:
                     line_lower = line.lower()
                     # Check if any key words from step name appear in the log marker
                     if any(word in line_lower for word in step_words):
-                        # Extract this section
-                        step_lines = [line]
-
-                        # Capture until endgroup
-                        for j in range(i + 1, len(log_lines)):
-                            next_line = log_lines[j]
-                            step_lines.append(next_line)
-
-                            if "##[endgroup]" in next_line:
-                                # Continue capturing a few more lines for errors that appear after endgroup
-                                LogParser._capture_post_endgroup_lines(log_lines, j, step_lines)
-                                break
-
-                        return "\n".join(step_lines) if step_lines else None
+                        return "\n".join(LogParser._capture_group(log_lines, i))
 
         return None
 
@@ -245,22 +226,7 @@ class LogParser:
 
         for run_index in possible_indices:
             if 0 <= run_index < len(run_markers):
-                step_start_index = run_markers[run_index]
-
-                # Extract the section from this marker
-                step_lines = [log_lines[step_start_index]]
-
-                # Capture until endgroup
-                for j in range(step_start_index + 1, len(log_lines)):
-                    next_line = log_lines[j]
-                    step_lines.append(next_line)
-
-                    if "##[endgroup]" in next_line:
-                        # Continue capturing a few more lines for errors that appear after endgroup
-                        LogParser._capture_post_endgroup_lines(log_lines, j, step_lines)
-                        break
-
-                content = "\n".join(step_lines)
+                content = "\n".join(LogParser._capture_group(log_lines, run_markers[run_index]))
                 # Basic validation - check if this looks like the right step
                 if step_name.lower().replace(" ", "") in content.lower().replace(" ", ""):
                     return content
@@ -268,21 +234,24 @@ class LogParser:
         return None
 
     @staticmethod
-    def _extract_step_by_exact_name(log_lines: list[str], step_name: str) -> str | None:
-        """Extract step logs using exact name matching."""
-        step_lines = []
-        capturing = False
+    def _extract_step_by_exact_name(
+        log_lines: list[str], run_groups: list[tuple[int, str]], step_name: str
+    ) -> list[str] | None:
+        """Extract step logs using exact name matching against indexed Run markers."""
+        # The first marker reading "##[group]Run <step_name>..." starts this step
+        start = next((i for i, header in run_groups if header.startswith(step_name)), None)
+        if start is None:
+            return None
 
-        for i, line in enumerate(log_lines):
-            # Early return if we find the exact step
-            if f"##[group]Run {step_name}" in line:
-                capturing = True
-                step_lines.append(line)
-                continue
+        return LogParser._capture_group(log_lines, start)
 
-            if not capturing:
-                continue
+    @staticmethod
+    def _capture_group(log_lines: list[str], start: int) -> list[str]:
+        """Capture a group from its marker at start through ##[endgroup] and trailing errors."""
+        step_lines = [log_lines[start]]
 
+        for i in range(start + 1, len(log_lines)):
+            line = log_lines[i]
             step_lines.append(line)
 
             # Stop capturing when we hit the endgroup for this step
@@ -291,38 +260,7 @@ class LogParser:
                 LogParser._capture_post_endgroup_lines(log_lines, i, step_lines)
                 break
 
-        return "\n".join(step_lines) if step_lines else None
-
-    @staticmethod
-    def _extract_step_by_partial_name(log_lines: list[str], step_name: str) -> str | None:
-        """Extract step logs using partial name matching as fallback."""
-        keywords = [word for word in step_name.split() if len(word) > MIN_WORD_LENGTH_PARTIAL]
-        if not keywords:
-            return None
-
-        for i, line in enumerate(log_lines):
-            # Look for key words from the step name in group markers
-            if "##[group]Run" not in line:
-                continue
-
-            if not any(word.lower() in line.lower() for word in keywords):
-                continue
-
-            step_lines = [line]
-
-            # Capture until endgroup
-            for j in range(i + 1, len(log_lines)):
-                next_line = log_lines[j]
-                step_lines.append(next_line)
-
-                if "##[endgroup]" in next_line:
-                    # Get a few more lines for error context
-                    LogParser._capture_post_endgroup_lines(log_lines, j, step_lines)
-                    break
-
-            return "\n".join(step_lines) if step_lines else None
-
-        return None
+        return step_lines
 
     @staticmethod
     def _capture_post_endgroup_lines(
@@ -340,30 +278,27 @@ class LogParser:
                 break
 
     @staticmethod
-    def filter_error_lines(step_log: str) -> list[str]:
-        """Filter step logs to show only error-related content."""
-        step_lines = step_log.split("\n")
-        shown_lines = []
+    def filter_error_lines_with_tail(
+        step_lines: Iterable[str], tail_size: int = FALLBACK_LOG_LINES
+    ) -> tuple[list[str], deque[str]]:
+        """Filter error-related lines and keep the last non-empty lines in the same pass.
 
-        error_keywords = ["error", "failed", "failure", "❌", "✗", "exit code", "##[error]"]
+        Returns (shown_lines, tail). The tail is the fallback when nothing in the step
+        looks like an error; it is empty only if the step has no non-empty lines.
+        """
+        shown_lines = []
+        tail: deque[str] = deque(maxlen=tail_size)
 
         for line in step_lines:
             # Early continue for empty lines
             if not line.strip():
                 continue
 
-            # Include lines with error keywords
-            if any(keyword in line.lower() for keyword in error_keywords):
-                shown_lines.append(line)
-                continue
-
-            # Include GitHub Actions markers
-            if "##[group]" in line or "##[endgroup]" in line:
-                shown_lines.append(line)
-                continue
+            tail.append(line)
 
-            # Include non-timestamp lines (command output, not just timestamps)
-            if not line.startswith(CURRENT_YEAR_PREFIX):
+            # Include command output (non-timestamp lines), error lines and group markers.
+            # The anchored timestamp match is cheap, so it runs before the keyword scan
+            if not TIMESTAMP_PREFIX_RE.match(line) or _SHOWN_LINE_RE.search(line):
                 shown_lines.append(line)
 
-        return shown_lines
+        return shown_lines, tail
@@ -4,14 +4,40 @@ This module contains the core business logic separated from presentation concern
 All functions use early-return patterns to avoid deep nesting.
 """
 
+from __future__ import annotations
+
+import calendar
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from .constants import FALLBACK_LOG_LINES
-from .fetcher import GitHubCIFetcher
+from .constants import MAX_CONCURRENT_REQUESTS
 from .log_parser import LogParser
 
+if TYPE_CHECKING:
+    from .fetcher import GitHubCIFetcher
+
+# The numeric ID in '.../actions/runs/<run_id>', as a whole segment of the URL path
+_RUN_ID_RE = re.compile(r"[^?#]*?/actions/runs/(\d+)(?:[/?#]|$)")
+
+# (status, conclusion) of a workflow run -> (emoji, completed, failed). A conclusion
+# of None is the fallback for its status, e.g. a completed run that timed out.
+_RUN_STATUS_TABLE: dict[tuple[str, str | None], tuple[str, bool, bool]] = {
+    ("completed", "success"): ("✅", True, False),
+    ("completed", "failure"): ("❌", True, True),
+    ("completed", "cancelled"): ("🚫", True, True),
+    ("completed", None): ("⚠️", True, True),
+    ("in_progress", None): ("🔄", False, False),
+    ("queued", None): ("⏳", False, False),
+}
+_UNKNOWN_RUN_STATUS = ("❓", False, False)
+
+# Timestamp prefix of a log line plus its separating space (2025-07-16T03:13:13.5152643Z )
+_LOG_TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T[\d:.]+Z ", re.MULTILINE)
+
 
 class CIStatusResult:
     """Result object for CI status operations."""
@@ -64,7 +90,7 @@ def get_ci_status(
     Returns:
         CIStatusResult with failed jobs and details
     """
-    failed_check_runs = fetcher.find_failed_jobs_in_latest_run(owner, repo_name, commit_sha)
+    failed_check_runs = _find_failed_check_runs(fetcher, owner, repo_name, commit_sha)
     result = CIStatusResult(failed_check_runs, target_description)
 
     # Check for merge conflicts if this is a PR
@@ -99,16 +125,21 @@ def get_job_details_for_status(
 
     job_details = JobDetails(name, html_url, conclusion)
 
-    # Early return if not a workflow run
-    if "actions/runs" not in html_url:
+    # Check runs from the GraphQL failure tree already carry their steps
+    if "steps" in check_run:
+        _add_failed_steps_to_job_details(fetcher, [check_run], job_details)
         return job_details
 
     try:
+        # Not a workflow run if there is no run ID in the URL
         run_id = _extract_run_id_from_url(html_url)
         if not run_id:
             return job_details
 
+        # An Actions job with more steps than the failure tree's page holds; fetch
+        # its run's jobs and keep the one this check run is (its ID is the job ID)
         jobs = fetcher.get_workflow_jobs(owner, repo_name, run_id)
+        jobs = [job for job in jobs if job.get("id") == check_run.get("id")]
         _add_failed_steps_to_job_details(fetcher, jobs, job_details)
 
     except (ValueError, KeyError, TypeError):
@@ -216,6 +247,7 @@ def watch_ci_status(
         return {
             "status": "stop_on_failure",
             "workflows": status_summary["workflows"],
+            "last_updated": status_summary["last_updated"],
             "continue_watching": False,
         }
 
@@ -223,6 +255,7 @@ def watch_ci_status(
         return {
             "status": "in_progress",
             "workflows": status_summary["workflows"],
+            "last_updated": status_summary["last_updated"],
             "continue_watching": True,
         }
 
@@ -231,6 +264,7 @@ def watch_ci_status(
         return {
             "status": "retry_needed",
             "workflows": status_summary["workflows"],
+            "last_updated": status_summary["last_updated"],
             "failed_runs": status_summary["failed_runs"],
             "continue_watching": True,
         }
@@ -239,12 +273,14 @@ def watch_ci_status(
         return {
             "status": "failed",
             "workflows": status_summary["workflows"],
+            "last_updated": status_summary["last_updated"],
             "continue_watching": False,
         }
 
     return {
         "status": "success",
         "workflows": status_summary["workflows"],
+        "last_updated": status_summary["last_updated"],
         "continue_watching": False,
     }
 
@@ -263,17 +299,50 @@ def retry_failed_workflows(
     Returns:
         Dictionary mapping run_id to success status
     """
-    results = {}
-    for run_id in failed_run_ids:
-        results[run_id] = fetcher.rerun_failed_jobs(owner, repo_name, run_id)
-    return results
+    # Rerun requests are independent, so send them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        outcomes = executor.map(
+            lambda run_id: fetcher.rerun_failed_jobs(owner, repo_name, run_id), failed_run_ids
+        )
+        return dict(zip(failed_run_ids, outcomes, strict=True))
 
 
 # Private helper functions
 
 
+def _find_failed_check_runs(
+    fetcher: GitHubCIFetcher, owner: str, repo_name: str, commit_sha: str
+) -> list[dict[str, Any]]:
+    """Find failed check runs, preferring the single-request GraphQL failure tree."""
+    try:
+        return fetcher.fetch_failure_tree(owner, repo_name, commit_sha)
+    except ValueError:
+        # Fall back to REST if GraphQL is unavailable (e.g. token or server limitations)
+        # or the failures did not fit in one page
+        return _find_failed_workflow_jobs(fetcher, owner, repo_name, commit_sha)
+
+
+def _find_failed_workflow_jobs(
+    fetcher: GitHubCIFetcher, owner: str, repo_name: str, commit_sha: str
+) -> list[dict[str, Any]]:
+    """Find failed jobs through the commit's workflow runs.
+
+    Jobs carry their steps, IDs and conclusions, so callers never need a second
+    jobs request or to parse run IDs back out of check run URLs. Runs that
+    succeeded cannot contain failed jobs and are skipped.
+    """
+    workflow_runs = fetcher.get_all_workflow_runs_for_commit(owner, repo_name, commit_sha)
+    run_ids = [run["id"] for run in workflow_runs if run.get("conclusion") != "success"]
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        all_jobs = executor.map(
+            lambda run_id: fetcher.get_workflow_jobs(owner, repo_name, run_id), run_ids
+        )
+        return [job for jobs in all_jobs for job in jobs if job.get("conclusion") == "failure"]
+
+
 def _extract_run_id_from_url(html_url: str) -> int | None:
-    """Extract run ID from GitHub Actions URL using proper URL parsing.
+    """Extract run ID from a GitHub Actions URL with a single regex search.
 
     Args:
         html_url: GitHub Actions URL like 'https://github.com/owner/repo/actions/runs/123456/jobs/789'
@@ -281,33 +350,20 @@ def _extract_run_id_from_url(html_url: str) -> int | None:
     Returns:
         The run ID (123456) or None if URL is invalid or doesn't contain a run ID
     """
-    if not html_url or "actions/runs" not in html_url:
+    # The substring test rejects non-Actions URLs without touching the regex or the cache
+    if not html_url or "/actions/runs/" not in html_url:
         return None
 
-    try:
-        parsed_url = urlparse(html_url)
-        if not parsed_url.path:
-            return None
-
-        # Split path into components and find 'runs' segment
-        path_parts = [part for part in parsed_url.path.split("/") if part]
-
-        # Look for pattern: [..., 'actions', 'runs', '<run_id>', ...]
-        for i, part in enumerate(path_parts):
-            if (
-                part == "runs"
-                and i > 0
-                and path_parts[i - 1] == "actions"
-                and i + 1 < len(path_parts)
-            ):
-                run_id_str = path_parts[i + 1]
-                if run_id_str.isdigit():
-                    return int(run_id_str)
-                break
+    return _cached_extract(html_url)
 
-        return None
-    except (ValueError, AttributeError):
-        return None
+
+@lru_cache(maxsize=1024)
+def _cached_extract(html_url: str) -> int | None:
+    """Match the run ID in a non-empty URL; memoized since every poll revisits the same URLs."""
+    # Anchored at the start and kept out of the query and fragment, so a run URL
+    # passed as a parameter of some other page doesn't match
+    match = _RUN_ID_RE.match(html_url)
+    return int(match[1], 10) if match else None
 
 
 def _add_failed_steps_to_job_details(
@@ -328,21 +384,49 @@ def _add_failed_steps_to_job_details(
             job_details.failed_steps.append(step_info)
 
 
+@lru_cache(maxsize=2048)
+def _parse_github_timestamp(timestamp: str) -> float:
+    """Parse a GitHub API timestamp into POSIX seconds.
+
+    GitHub reports UTC times as 'YYYY-MM-DDTHH:MM:SSZ', which is sliced directly;
+    any other ISO 8601 form goes through datetime.fromisoformat. Results are
+    memoized because watch re-reads the same run timestamps on every poll.
+    """
+    if (
+        len(timestamp) == 20
+        and timestamp[4] == timestamp[7] == "-"
+        and timestamp[10] == "T"
+        and timestamp[13] == timestamp[16] == ":"
+        and timestamp[19] == "Z"
+    ):
+        return calendar.timegm(
+            (
+                int(timestamp[0:4]),
+                int(timestamp[5:7]),
+                int(timestamp[8:10]),
+                int(timestamp[11:13]),
+                int(timestamp[14:16]),
+                int(timestamp[17:19]),
+                0,
+                0,
+                0,
+            )
+        )
+
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+
+
 def _calculate_step_duration(step: dict[str, Any]) -> str:
     """Calculate duration for a workflow step."""
     if not step.get("started_at") or not step.get("completed_at"):
         return "Unknown"
 
     try:
-        start = datetime.fromisoformat(step["started_at"].replace("Z", "+00:00"))
-        end = datetime.fromisoformat(step["completed_at"].replace("Z", "+00:00"))
-        return f"{(end - start).total_seconds():.1f}s"
-    except (ValueError, TypeError):
-        # Handle invalid timestamp format or missing data
-        return "Unknown"
-    except Exception:
-        # Handle other unexpected errors in datetime calculation
-        # TODO: Add proper logging here
+        start = _parse_github_timestamp(step["started_at"])
+        end = _parse_github_timestamp(step["completed_at"])
+        return f"{end - start:.1f}s"
+    except (ValueError, TypeError, AttributeError):
+        # Invalid timestamp format or a non-string value from the API
         return "Unknown"
 
 
@@ -355,21 +439,17 @@ def _get_specific_job_logs(
     step_filter: str | None = None,
     group_filter: str | None = None,
 ) -> dict[str, Any]:
-    """Get logs for a specific job ID."""
-    job_info = fetcher.get_job_by_id(owner, repo_name, job_id)
-    logs_content = fetcher.get_job_logs(owner, repo_name, job_id)
+    """Get logs for a specific job ID.
 
-    # Add group analysis
-    groups = LogParser.parse_log_groups(logs_content)
-
-    # Apply filters
-    filtered_groups = _apply_group_filters(groups, step_filter, group_filter)
+    The logs are returned as a lazy iterator of text chunks, so the CLI can print
+    them as they download instead of buffering multi-MB logs first.
+    """
+    job_info = fetcher.get_job_by_id(owner, repo_name, job_id)
 
     return {
         "type": "specific_job",
         "job_info": job_info,
-        "logs": logs_content,
-        "groups": filtered_groups,
+        "logs": fetcher.iter_job_logs(owner, repo_name, job_id),
         "show_groups": show_groups,
         "filters": {"step_filter": step_filter, "group_filter": group_filter},
     }
@@ -379,21 +459,23 @@ def _get_raw_logs_for_commit(
     fetcher: GitHubCIFetcher, owner: str, repo_name: str, commit_sha: str
 ) -> dict[str, Any]:
     """Get raw logs for all failed jobs in a commit."""
-    all_jobs = fetcher.get_all_jobs_for_commit(owner, repo_name, commit_sha)
-    failed_jobs = [job for job in all_jobs if job.get("conclusion") == "failure"]
+    failed_jobs = fetcher.get_all_jobs_for_commit(
+        owner, repo_name, commit_sha, conclusion_filter="failure"
+    )
 
     if not failed_jobs:
         return {"type": "raw_logs", "failed_jobs": [], "has_failures": False}
 
-    # Fetch logs for each failed job
-    job_logs = []
-    for job in failed_jobs:
-        job_id = job.get("id")
-        if not job_id:
-            continue
-
-        logs_content = fetcher.get_job_logs(owner, repo_name, job_id)
-        job_logs.append({"job": job, "logs": logs_content})
+    # Download every failed job's logs concurrently; map keeps the jobs in order
+    jobs_with_ids = [job for job in failed_jobs if job.get("id")]
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        all_logs = executor.map(
+            lambda job: fetcher.get_job_logs(owner, repo_name, job["id"]), jobs_with_ids
+        )
+        job_logs = [
+            {"job": job, "logs": logs_content}
+            for job, logs_content in zip(jobs_with_ids, all_logs, strict=True)
+        ]
 
     return {"type": "raw_logs", "failed_jobs": job_logs, "has_failures": True}
 
@@ -416,23 +498,12 @@ def _apply_group_filters(
 
 
 def _remove_timestamps(logs: str) -> str:
-    """Remove timestamp prefixes from log lines for cleaner output."""
-    lines = logs.split("\n")
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove timestamp prefix (format: 2025-07-16T03:13:13.5152643Z)
-        if line.startswith("20") and "T" in line and "Z" in line:
-            # Find the first space after the timestamp and remove everything before it
-            parts = line.split(" ", 1)
-            if len(parts) > 1:
-                cleaned_lines.append(parts[1])
-            else:
-                cleaned_lines.append(line)
-        else:
-            cleaned_lines.append(line)
+    """Remove timestamp prefixes from log lines for cleaner output.
 
-    return "\n".join(cleaned_lines)
+    A single multiline substitution over the whole text, so multi-MB job logs
+    aren't split into a list of lines and joined back together.
+    """
+    return _LOG_TIMESTAMP_RE.sub("", logs)
 
 
 def _get_filtered_error_logs(
@@ -446,7 +517,7 @@ def _get_filtered_error_logs(
     group_filter: str | None = None,
 ) -> dict[str, Any]:
     """Get filtered error logs for failed jobs."""
-    failed_check_runs = fetcher.find_failed_jobs_in_latest_run(owner, repo_name, commit_sha)
+    failed_check_runs = _find_failed_check_runs(fetcher, owner, repo_name, commit_sha)
 
     if not failed_check_runs:
         return {
@@ -463,10 +534,19 @@ def _get_filtered_error_logs(
     all_groups = []
     seen_groups = set()  # Track unique groups by (name, type)
 
-    for check_run in failed_check_runs:
-        job_log_info = _process_check_run_for_logs(
-            fetcher, owner, repo_name, check_run, show_groups, step_filter, group_filter
+    # Each check run needs its own jobs + logs round trips, so fetch them concurrently.
+    # executor.map preserves input order, keeping the output deterministic.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        job_log_infos = list(
+            executor.map(
+                lambda check_run: _process_check_run_for_logs(
+                    fetcher, owner, repo_name, check_run, show_groups, step_filter, group_filter
+                ),
+                failed_check_runs,
+            )
         )
+
+    for job_log_info in job_log_infos:
         if job_log_info:
             job_logs.append(job_log_info)
             # Collect groups from each job, avoiding duplicates
@@ -511,13 +591,27 @@ def _process_check_run_for_logs(
         }
 
     try:
-        run_id = _extract_run_id_from_url(html_url)
-        if not run_id:
-            return None
+        if "steps" in check_run and check_run.get("id"):
+            # GraphQL check runs already carry their steps, and their ID is the job ID
+            jobs = [check_run]
+        else:
+            # Steps were truncated in the failure tree; fetch the run's jobs instead
+            run_id = _extract_run_id_from_url(html_url)
+            if not run_id:
+                return None
+
+            jobs = fetcher.get_workflow_jobs(owner, repo_name, run_id)
 
-        jobs = fetcher.get_workflow_jobs(owner, repo_name, run_id)
         return _extract_step_logs_from_jobs(
-            fetcher, owner, repo_name, jobs, name, show_groups, step_filter, group_filter
+            fetcher,
+            owner,
+            repo_name,
+            jobs,
+            name,
+            show_groups,
+            step_filter,
+            group_filter,
+            check_run_id=check_run.get("id"),
         )
 
     except (ValueError, KeyError, TypeError) as e:
@@ -545,8 +639,15 @@ def _extract_step_logs_from_jobs(
     show_groups: bool = True,
     step_filter: str | None = None,
     group_filter: str | None = None,
+    check_run_id: int | None = None,
 ) -> dict[str, Any] | None:
     """Extract step logs from workflow jobs."""
+    # An Actions check run shares its ID with the job it reports on. Without this, every
+    # failing job of one workflow run would download and show the first failing job's logs.
+    matching_jobs = [job for job in jobs if job.get("id") == check_run_id]
+    if matching_jobs:
+        jobs = matching_jobs
+
     for job in jobs:
         if job.get("conclusion") != "failure":
             continue
@@ -560,29 +661,28 @@ def _extract_step_logs_from_jobs(
         logs_content = fetcher.get_job_logs(owner, repo_name, job_id)
         all_steps = job.get("steps", [])
 
+        # Split the log once; group parsing, step extraction and filtering share the lines
+        log_lines = logs_content.split("\n")
+
         # Add group analysis and step status
-        groups = LogParser.parse_log_groups(logs_content)
+        groups = LogParser.parse_log_groups_from_lines(log_lines)
         filtered_groups = _apply_group_filters(groups, step_filter, group_filter)
         step_status = LogParser.get_step_status_info(all_steps, failed_steps)
 
-        step_logs = LogParser.extract_step_logs(logs_content, failed_steps, all_steps)
+        step_logs = LogParser.extract_step_lines(log_lines, failed_steps)
 
         if step_logs:
             # Filter each step's logs for errors and remove timestamps
             filtered_step_logs = {}
-            for step_name, step_log in step_logs.items():
-                if step_log.strip():
-                    shown_lines = LogParser.filter_error_lines(step_log)
-                    if shown_lines:
-                        clean_log = "\n".join(shown_lines)
-                        filtered_step_logs[step_name] = _remove_timestamps(clean_log)
-                    else:
-                        # Fallback to last few lines
-                        step_lines = step_log.split("\n")
-                        clean_log = "\n".join(
-                            line for line in step_lines[-FALLBACK_LOG_LINES:] if line.strip()
-                        )
-                        filtered_step_logs[step_name] = _remove_timestamps(clean_log)
+            for step_name, step_lines in step_logs.items():
+                shown_lines, tail = LogParser.filter_error_lines_with_tail(step_lines)
+                if not tail:
+                    # Nothing but blank lines in this step
+                    continue
+
+                # Fall back to the step's last few lines when nothing looks like an error
+                clean_log = "\n".join(shown_lines or tail)
+                filtered_step_logs[step_name] = _remove_timestamps(clean_log)
 
             return {
                 "name": job_name,
@@ -613,11 +713,17 @@ def _analyze_workflow_runs(workflow_runs: list[dict[str, Any]]) -> dict[str, Any
     any_failed = False
     failed_runs = []
     workflows = []
+    last_updated = None
 
     for run in workflow_runs:
         workflow_info = _process_single_workflow_run(run)
         workflows.append(workflow_info)
 
+        # ISO 8601 UTC timestamps compare correctly as strings
+        updated_at = run.get("updated_at")
+        if updated_at and (last_updated is None or updated_at > last_updated):
+            last_updated = updated_at
+
         if not workflow_info["completed"]:
             all_completed = False
 
@@ -630,6 +736,7 @@ def _analyze_workflow_runs(workflow_runs: list[dict[str, Any]]) -> dict[str, Any
         "any_failed": any_failed,
         "failed_runs": failed_runs,
         "workflows": workflows,
+        "last_updated": last_updated,
     }
 
 
@@ -642,27 +749,10 @@ def _process_single_workflow_run(run: dict[str, Any]) -> dict[str, Any]:
     # Calculate duration
     duration_str = _calculate_workflow_duration(run)
 
-    # Determine status info
-    if status == "completed":
-        completed = True
-        if conclusion == "success":
-            emoji = "✅"
-            failed = False
-        else:
-            emoji = "❌" if conclusion == "failure" else "🚫" if conclusion == "cancelled" else "⚠️"
-            failed = True
-    elif status == "in_progress":
-        emoji = "🔄"
-        completed = False
-        failed = False
-    elif status == "queued":
-        emoji = "⏳"
-        completed = False
-        failed = False
-    else:
-        emoji = "❓"
-        completed = False
-        failed = False
+    # Exact (status, conclusion) match first, then the status' catch-all entry
+    emoji, completed, failed = _RUN_STATUS_TABLE.get(
+        (status, conclusion), _RUN_STATUS_TABLE.get((status, None), _UNKNOWN_RUN_STATUS)
+    )
 
     return {
         "name": name,
@@ -684,17 +774,9 @@ def _calculate_workflow_duration(run: dict[str, Any]) -> str:
         return "unknown"
 
     try:
-        start = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        if updated_at:
-            end = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-        else:
-            end = datetime.now(start.tzinfo)
-        duration = end - start
-        return f"{int(duration.total_seconds())}s"
-    except (ValueError, TypeError):
-        # Handle invalid timestamp format or missing timezone info
-        return "unknown"
-    except Exception:
-        # Handle other unexpected errors in datetime calculation
-        # TODO: Add proper logging here
+        start = _parse_github_timestamp(created_at)
+        end = _parse_github_timestamp(updated_at) if updated_at else time.time()
+        return f"{int(end - start)}s"
+    except (ValueError, TypeError, AttributeError):
+        # Invalid timestamp format or a non-string value from the API
         return "unknown"
@@ -0,0 +1,218 @@
+"""Tests for the on-disk response cache."""
+
+import stat
+import time
+from unittest.mock import Mock, patch
+
+from cimonitor.cache import ResponseCache
+from cimonitor.cli import _create_fetcher
+from cimonitor.fetcher import GitHubCIFetcher
+
+
+def test_response_cache_round_trip(tmp_path):
+    """Test storing and retrieving ETag-tagged responses."""
+    cache = ResponseCache(tmp_path / "http.db")
+
+    assert cache.get_response("scope", "https://api.github.com/x") is None
+
+    cache.store_response("scope", "https://api.github.com/x", '"abc"', '{"sha": "123"}')
+
+    assert cache.get_response("scope", "https://api.github.com/x")[:2] == (
+        '"abc"',
+        '{"sha": "123"}',
+    )
+
+
+def test_response_cache_job_logs(tmp_path):
+    """Test storing and retrieving job logs by job ID."""
+    cache = ResponseCache(tmp_path / "http.db")
+
+    assert cache.get_job_logs("scope", 123) is None
+
+    cache.store_job_logs("scope", 123, "log content")
+
+    assert cache.get_job_logs("scope", 123) == "log content"
+    # Persisted across instances
+    assert ResponseCache(tmp_path / "http.db").get_job_logs("scope", 123) == "log content"
+
+
+def test_response_cache_prunes_expired_entries_on_open(tmp_path):
+    """Test that entries older than max_age are deleted when the database is opened."""
+    cache = ResponseCache(tmp_path / "http.db")
+    with patch("cimonitor.cache.time.time", return_value=time.time() - 3600):
+        cache.store_response("scope", "https://api.github.com/old", '"a"', "{}")
+        cache.store_job_logs("scope", 1, "old logs")
+    cache.store_response("scope", "https://api.github.com/new", '"b"', "{}")
+
+    reopened = ResponseCache(tmp_path / "http.db", max_age=60)
+
+    assert reopened.get_response("scope", "https://api.github.com/old") is None
+    assert reopened.get_job_logs("scope", 1) is None
+    assert reopened.get_response("scope", "https://api.github.com/new") is not None
+
+
+def test_response_cache_is_private_to_its_owner(tmp_path):
+    """Test that the cache directory and database are not readable by other users."""
+    cache = ResponseCache(tmp_path / "cimonitor" / "http.db")
+
+    cache.store_job_logs("scope", 123, "private logs")
+
+    assert stat.S_IMODE((tmp_path / "cimonitor").stat().st_mode) == 0o700
+    assert stat.S_IMODE((tmp_path / "cimonitor" / "http.db").stat().st_mode) == 0o600
+
+
+def test_cache_can_be_disabled_by_environment(monkeypatch):
+    """Test that CIMONITOR_NO_CACHE creates a fetcher without the on-disk cache."""
+    monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+    monkeypatch.setenv("CIMONITOR_NO_CACHE", "1")
+
+    assert _create_fetcher().cache is None
+
+
+def test_response_cache_unwritable_path_is_disabled(tmp_path):
+    """Test that an unusable cache location degrades to a no-op."""
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    cache = ResponseCache(blocker / "http.db")
+
+    cache.store_job_logs("scope", 123, "log content")
+
+    assert cache.get_job_logs("scope", 123) is None
+
+
+@patch("requests.Session.get")
+def test_fetcher_revalidates_with_etag(mock_get, tmp_path):
+    """Test that cached responses are revalidated and reused on 304."""
+    fetcher = GitHubCIFetcher("test_token", cache=ResponseCache(tmp_path / "http.db"))
+    url = "https://api.github.com/repos/owner/repo/branches/main"
+
+    first = Mock(status_code=200, headers={"ETag": '"v1"'}, content=b'{"commit": {"sha": "abc"}}')
+    not_modified = Mock(status_code=304, headers={})
+    mock_get.side_effect = [first, not_modified]
+
+    assert fetcher.get_branch_head_sha("owner", "repo", "main") == "abc"
+    assert fetcher.get_branch_head_sha("owner", "repo", "main") == "abc"
+
+    second_call_headers = mock_get.call_args_list[1].kwargs["headers"]
+    assert second_call_headers["If-None-Match"] == '"v1"'
+    assert mock_get.call_args_list[1].args == (url,)
+
+
+@patch("requests.Session.get")
+def test_fetcher_revalidates_in_memory_without_disk_cache(mock_get):
+    """Test that repeat requests in one process revalidate without any disk cache."""
+    fetcher = GitHubCIFetcher("test_token")
+
+    first = Mock(status_code=200, headers={"ETag": '"v1"'}, content=b'{"workflow_runs": []}')
+    not_modified = Mock(status_code=304, headers={}, content=b"")
+    mock_get.side_effect = [first, not_modified]
+
+    assert fetcher.get_workflow_runs_for_commit("owner", "repo", "abc") == []
+    assert fetcher.get_workflow_runs_for_commit("owner", "repo", "abc") == []
+
+    assert mock_get.call_args_list[0].kwargs["headers"] is None
+    assert mock_get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@patch("requests.Session.get")
+def test_fetcher_serves_completed_job_logs_from_cache(mock_get, tmp_path):
+    """Test that completed job logs are only downloaded once."""
+    fetcher = GitHubCIFetcher("test_token", cache=ResponseCache(tmp_path / "http.db"))
+    mock_get.return_value = Mock(encoding="utf-8")
+    mock_get.return_value.iter_content.return_value = [b"log content"]
+
+    assert fetcher.get_job_logs("owner", "repo", 123) == "log content"
+    assert fetcher.get_job_logs("owner", "repo", 123) == "log content"
+
+    assert mock_get.call_count == 1
+
+
+@patch("requests.Session.get")
+def test_fetcher_reuses_fresh_workflow_runs_across_processes(mock_get, tmp_path):
+    """Test that a just-fetched run listing is reused by the next process, then revalidated."""
+    cache = ResponseCache(tmp_path / "http.db")
+    runs = b'{"workflow_runs": [{"id": 1, "status": "in_progress"}]}'
+    mock_get.return_value = Mock(status_code=200, headers={"ETag": '"v1"'}, content=runs)
+
+    GitHubCIFetcher("test_token", cache=cache).get_workflow_runs_for_commit("owner", "repo", "abc")
+
+    # A second invocation moments later is answered from disk without a request
+    fetcher = GitHubCIFetcher("test_token", cache=cache)
+    assert fetcher.get_workflow_runs_for_commit("owner", "repo", "abc")[0]["id"] == 1
+    assert mock_get.call_count == 1
+
+    # Later polls in that process still revalidate
+    mock_get.return_value = Mock(status_code=304, headers={}, content=b"")
+    assert fetcher.get_workflow_runs_for_commit("owner", "repo", "abc")[0]["id"] == 1
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@patch("requests.Session.get")
+def test_fetcher_revalidates_fresh_completed_workflow_runs(mock_get, tmp_path):
+    """Test that a fresh listing where every run completed is still revalidated."""
+    cache = ResponseCache(tmp_path / "http.db")
+    runs = b'{"workflow_runs": [{"id": 1, "status": "completed", "conclusion": "success"}]}'
+    mock_get.return_value = Mock(status_code=200, headers={"ETag": '"v1"'}, content=runs)
+
+    GitHubCIFetcher("test_token", cache=cache).get_workflow_runs_for_commit("owner", "repo", "abc")
+
+    # A run started since then must not be missed, so the next process asks again
+    mock_get.return_value = Mock(status_code=304, headers={}, content=b"")
+    fetcher = GitHubCIFetcher("test_token", cache=cache)
+    assert fetcher.get_workflow_runs_for_commit("owner", "repo", "abc")[0]["id"] == 1
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@patch("requests.Session.get")
+def test_fetcher_revalidates_stale_workflow_runs(mock_get, tmp_path):
+    """Test that a run listing older than the freshness window is revalidated."""
+    cache = ResponseCache(tmp_path / "http.db")
+    fetcher = GitHubCIFetcher("test_token", cache=cache)
+    cache.store_response(
+        fetcher._cache_scope,
+        "https://api.github.com/repos/owner/repo/actions/runs?head_sha=abc&per_page=10",
+        '"v1"',
+        '{"workflow_runs": []}',
+    )
+    mock_get.return_value = Mock(status_code=304, headers={}, content=b"")
+
+    with patch("cimonitor.fetcher.time.time", return_value=time.time() + 31):
+        assert fetcher.get_workflow_runs_for_commit("owner", "repo", "abc") == []
+
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@patch("requests.Session.get")
+def test_fetcher_always_revalidates_full_workflow_run_listing(mock_get, tmp_path):
+    """Test that the full run listing asks for a whole page and never skips revalidation."""
+    cache = ResponseCache(tmp_path / "http.db")
+    runs = b'{"workflow_runs": [{"id": 1, "status": "in_progress"}]}'
+    mock_get.return_value = Mock(status_code=200, headers={"ETag": '"v1"'}, content=runs)
+
+    GitHubCIFetcher("test_token", cache=cache).get_all_workflow_runs_for_commit(
+        "owner", "repo", "abc"
+    )
+    assert mock_get.call_args.kwargs["params"]["per_page"] == 100
+
+    mock_get.return_value = Mock(status_code=304, headers={}, content=b"")
+    fetcher = GitHubCIFetcher("test_token", cache=cache)
+    assert fetcher.get_all_workflow_runs_for_commit("owner", "repo", "abc")[0]["id"] == 1
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@patch("requests.Session.get")
+def test_fetcher_cache_is_scoped_by_token(mock_get, tmp_path):
+    """Test that responses and logs cached for one token are not served to another."""
+    cache = ResponseCache(tmp_path / "http.db")
+    mock_get.return_value = Mock(encoding="utf-8")
+    mock_get.return_value.iter_content.return_value = [b"private logs"]
+    GitHubCIFetcher("token_a", cache=cache).get_job_logs("owner", "repo", 123)
+
+    mock_get.return_value.iter_content.return_value = [b"other logs"]
+    assert GitHubCIFetcher("token_b", cache=cache).get_job_logs("owner", "repo", 123) == (
+        "other logs"
+    )
+    assert mock_get.call_count == 2
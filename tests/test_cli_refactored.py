@@ -1,5 +1,8 @@
 """Tests for the refactored CLI presentation logic."""
 
+import json
+import subprocess
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
@@ -21,7 +24,7 @@ def mock_fetcher():
     return Mock()
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.get_ci_status")
 def test_status_command_no_failures(
@@ -39,7 +42,7 @@ def test_status_command_no_failures(
     assert "✅ No failing CI jobs found for test branch!" in result.output
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.get_ci_status")
 @patch("cimonitor.cli.get_job_details_for_status")
@@ -56,7 +59,10 @@ def test_status_command_with_failures(
     mock_get_ci_status.return_value = CIStatusResult(failed_runs, "test branch")
 
     job_details = JobDetails("Test Job", "https://example.com", "failure")
-    job_details.failed_steps = [WorkflowStepInfo("Test Step", 1, "30.0s")]
+    job_details.failed_steps = [
+        WorkflowStepInfo("Test Step", 1, "30.0s"),
+        WorkflowStepInfo("Lint Step", 2, "5.0s"),
+    ]
     mock_get_job_details.return_value = job_details
 
     result = runner.invoke(cli, ["status"])
@@ -65,10 +71,46 @@ def test_status_command_with_failures(
     assert "❌ Found 1 failing CI job(s) for test branch:" in result.output
     assert "FAILED JOB #1: Test Job" in result.output
     assert "📋 Failed Steps in Test Job:" in result.output
-    assert "❌ Step 1: Test Step (took 30.0s)" in result.output
+    assert (
+        "  ❌ Step 1: Test Step (took 30.0s)\n  ❌ Step 2: Lint Step (took 5.0s)\n\n"
+    ) in result.output
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
+@patch("cimonitor.cli.get_target_info")
+@patch("cimonitor.cli.get_ci_status")
+@patch("cimonitor.cli.get_job_details_for_status")
+def test_status_command_keeps_job_order(
+    mock_get_job_details, mock_get_ci_status, mock_get_target_info, mock_fetcher_class, runner
+):
+    """Test that concurrently fetched job details are printed in check run order."""
+    mock_fetcher_class.return_value = Mock()
+    mock_get_target_info.return_value = ("owner", "repo", "abc123", "test branch", None)
+
+    failed_runs = [
+        {"name": f"Job {i}", "conclusion": "failure", "html_url": "https://example.com"}
+        for i in range(1, 4)
+    ]
+    mock_get_ci_status.return_value = CIStatusResult(failed_runs, "test branch")
+
+    def job_details_for(fetcher, owner, repo_name, check_run):
+        job_details = JobDetails(check_run["name"], check_run["html_url"], "failure")
+        job_details.failed_steps = [WorkflowStepInfo(f"{check_run['name']} step", 1, "1.0s")]
+        return job_details
+
+    mock_get_job_details.side_effect = job_details_for
+
+    result = runner.invoke(cli, ["status"])
+
+    assert result.exit_code == 0
+    positions = [result.output.index(f"FAILED JOB #{i}: Job {i}") for i in range(1, 4)]
+    assert positions == sorted(positions)
+    for i in range(1, 4):
+        job_header = result.output.index(f"FAILED JOB #{i}: Job {i}")
+        assert result.output.index(f"Step 1: Job {i} step") > job_header
+
+
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.get_job_logs")
 def test_logs_command_no_failures(
@@ -91,7 +133,7 @@ def test_logs_command_no_failures(
     assert "✅ No failing CI jobs found for test branch!" in result.output
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.get_job_logs")
 def test_logs_command_with_specific_job(
@@ -109,7 +151,7 @@ def test_logs_command_with_specific_job(
             "conclusion": "failure",
             "html_url": "https://example.com",
         },
-        "logs": "test log content",
+        "logs": iter(["test log ", "content"]),
     }
 
     result = runner.invoke(cli, ["logs", "--job-id", "123"])
@@ -120,7 +162,7 @@ def test_logs_command_with_specific_job(
     assert "test log content" in result.output
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.get_job_logs")
 def test_logs_command_raw(mock_get_job_logs, mock_get_target_info, mock_fetcher_class, runner):
@@ -142,7 +184,7 @@ def test_logs_command_raw(mock_get_job_logs, mock_get_target_info, mock_fetcher_
     assert "raw log content" in result.output
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.get_job_logs")
 def test_logs_command_filtered(mock_get_job_logs, mock_get_target_info, mock_fetcher_class, runner):
@@ -168,6 +210,57 @@ def test_logs_command_filtered(mock_get_job_logs, mock_get_target_info, mock_fet
     assert "error log content" in result.output
 
 
+@patch("cimonitor.fetcher.GitHubCIFetcher")
+@patch("cimonitor.cli.get_target_info")
+@patch("cimonitor.cli.get_job_logs")
+def test_logs_command_group_summary(
+    mock_get_job_logs, mock_get_target_info, mock_fetcher_class, runner
+):
+    """Test the group and step status summary shown above filtered logs."""
+    mock_fetcher_class.return_value = Mock()
+    mock_get_target_info.return_value = ("owner", "repo", "abc123", "test branch", None)
+    mock_get_job_logs.return_value = {
+        "type": "filtered_logs",
+        "target_description": "test branch",
+        "failed_jobs": [
+            {
+                "name": "Test Job",
+                "step_logs": {},
+                "error": None,
+                "step_status": {
+                    "Checkout": {"conclusion": "success"},
+                    "Run tests": {"conclusion": "failure"},
+                    "Deploy": {"conclusion": "skipped"},
+                },
+            }
+        ],
+        "has_failures": True,
+        "groups": [
+            {"name": "Set up job", "type": "setup", "line_number": 1, "nesting_level": 0},
+            {"name": "make test", "type": "step", "line_number": 10, "nesting_level": 0},
+            {"name": "pytest", "type": "step", "line_number": 12, "nesting_level": 1},
+        ],
+    }
+
+    result = runner.invoke(cli, ["logs"])
+
+    assert result.exit_code == 0
+    assert (
+        "🔧 Setup/System Groups:\n"
+        "  • Set up job (line 1)\n"
+        "🏃 Step Groups:\n"
+        "  • make test (line 10)\n"
+        "    • pytest (line 12)\n"
+    ) in result.output
+    assert (
+        "📊 Step Status Summary:\n"
+        "  ✅ 1 successful steps\n"
+        "  ❌ 1 failed steps:\n"
+        "    • Run tests\n"
+        "  ⏭️ Deploy (skipped)\n"
+    ) in result.output
+
+
 def test_validate_watch_options(runner):
     """Test watch option validation."""
     # Test conflicting options
@@ -186,7 +279,7 @@ def test_validate_watch_options(runner):
     assert "Cannot specify --retry with other watch options" in result.output
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.watch_ci_status")
 @patch("cimonitor.cli.time.sleep")  # Mock sleep to speed up test
@@ -211,7 +304,72 @@ def test_watch_command_success(
     assert "🎉 All workflows completed successfully!" in result.output
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
+@patch("cimonitor.cli.get_target_info")
+@patch("cimonitor.cli.get_ci_status")
+@patch("cimonitor.cli.get_job_details_for_status")
+def test_status_command_json(
+    mock_get_job_details, mock_get_ci_status, mock_get_target_info, mock_fetcher_class, runner
+):
+    """Test that --json prints one JSON object per failed job on stdout."""
+    mock_fetcher_class.return_value = Mock()
+    mock_get_target_info.return_value = ("owner", "repo", "abc123", "test branch", None)
+
+    failed_runs = [
+        {"name": f"Job {i}", "conclusion": "failure", "html_url": f"https://example.com/{i}"}
+        for i in range(1, 3)
+    ]
+    mock_get_ci_status.return_value = CIStatusResult(failed_runs, "test branch")
+
+    job_details = JobDetails("Job", "https://example.com", "failure")
+    job_details.failed_steps = [WorkflowStepInfo("Run tests", 3, "12s")]
+    mock_get_job_details.return_value = job_details
+
+    result = runner.invoke(cli, ["status", "--json"])
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert records == [
+        {
+            "job": f"Job {i}",
+            "conclusion": "failure",
+            "url": f"https://example.com/{i}",
+            "steps": [{"number": 3, "name": "Run tests", "duration": "12s"}],
+        }
+        for i in range(1, 3)
+    ]
+    assert "❌ Found 2 failing CI job(s)" in result.stderr
+
+
+@patch("cimonitor.fetcher.GitHubCIFetcher")
+@patch("cimonitor.cli.get_target_info")
+@patch("cimonitor.cli.watch_ci_status")
+@patch("cimonitor.cli.time.sleep")
+def test_watch_command_json(
+    mock_sleep, mock_watch_ci_status, mock_get_target_info, mock_fetcher_class, runner
+):
+    """Test that --json prints one JSON object per poll and keeps progress off stdout."""
+    mock_fetcher_class.return_value = Mock()
+    mock_get_target_info.return_value = ("owner", "repo", "abc123", "test branch", None)
+    running = [{"name": "Test", "emoji": "🔄", "status": "in_progress", "duration": "5s"}]
+    done = [{"name": "Test", "emoji": "✅", "status": "completed", "duration": "60s"}]
+    mock_watch_ci_status.side_effect = [
+        {"status": "in_progress", "continue_watching": True, "workflows": running},
+        {"status": "success", "continue_watching": False, "workflows": done},
+    ]
+
+    result = runner.invoke(cli, ["watch", "--json"])
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert records == [
+        {"tick": 1, "status": "in_progress", "runs": running},
+        {"tick": 2, "status": "success", "runs": done},
+    ]
+    assert "🎉 All workflows completed successfully!" in result.stderr
+
+
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.watch_ci_status")
 def test_watch_command_failure(
@@ -233,7 +391,7 @@ def test_watch_command_failure(
     assert "💥 Some workflows failed!" in result.output
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.watch_ci_status")
 @patch("cimonitor.cli.time.sleep")  # Mock sleep to speed up test
@@ -269,7 +427,7 @@ def test_watch_command_initial_wait_for_no_runs(
     assert mock_watch_ci_status.call_count == 2
 
 
-@patch("cimonitor.cli.GitHubCIFetcher")
+@patch("cimonitor.fetcher.GitHubCIFetcher")
 @patch("cimonitor.cli.get_target_info")
 @patch("cimonitor.cli.watch_ci_status")
 @patch("cimonitor.cli.time.sleep")  # Mock sleep to speed up test
@@ -299,9 +457,87 @@ def test_watch_command_no_runs_after_wait(
     assert mock_watch_ci_status.call_count >= 2
 
 
+@patch("cimonitor.fetcher.GitHubCIFetcher")
+@patch("cimonitor.cli.get_target_info")
+@patch("cimonitor.cli.watch_ci_status")
+@patch("cimonitor.cli.time.sleep")
+@patch("cimonitor.cli.random.uniform", return_value=0)
+def test_watch_command_backs_off_while_unchanged(
+    mock_uniform, mock_sleep, mock_watch_ci_status, mock_get_target_info, mock_fetcher_class, runner
+):
+    """Test that the poll interval doubles while runs are unchanged and resets on change."""
+    mock_fetcher_class.return_value = Mock()
+    mock_get_target_info.return_value = ("owner", "repo", "abc123", "test branch", None)
+    workflows = [{"name": "Test", "emoji": "🔄", "status": "in_progress", "duration": "60s"}]
+
+    def in_progress(last_updated):
+        return {
+            "status": "in_progress",
+            "continue_watching": True,
+            "workflows": workflows,
+            "last_updated": last_updated,
+        }
+
+    mock_watch_ci_status.side_effect = [
+        in_progress("2025-01-01T10:00:00Z"),
+        in_progress("2025-01-01T10:00:00Z"),
+        in_progress("2025-01-01T10:00:00Z"),
+        in_progress("2025-01-01T10:01:00Z"),
+        in_progress("2025-01-01T10:01:00Z"),
+        {"status": "success", "continue_watching": False, "workflows": workflows},
+    ]
+
+    result = runner.invoke(cli, ["watch"])
+
+    assert result.exit_code == 0
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 10, 20, 5, 10]
+    mock_uniform.assert_called_with(0, 2)
+    # The unchanged in-progress block is printed once, then once more for the final status
+    assert result.output.count("📊 Found 1 workflow run(s):") == 2
+
+
+@patch("cimonitor.fetcher.GitHubCIFetcher")
+@patch("cimonitor.cli.get_target_info")
+@patch("cimonitor.cli.watch_ci_status")
+@patch("cimonitor.cli.time.sleep")
+@patch("cimonitor.cli.random.uniform", return_value=0)
+def test_watch_command_times_out_after_budget(
+    mock_uniform, mock_sleep, mock_watch_ci_status, mock_get_target_info, mock_fetcher_class, runner
+):
+    """Test that watch gives up once the polling time budget is spent."""
+    mock_fetcher_class.return_value = Mock()
+    mock_get_target_info.return_value = ("owner", "repo", "abc123", "test branch", None)
+    mock_watch_ci_status.return_value = {
+        "status": "in_progress",
+        "continue_watching": True,
+        "workflows": [],
+        "last_updated": "2025-01-01T10:00:00Z",
+    }
+
+    result = runner.invoke(cli, ["watch"])
+
+    assert result.exit_code == 1
+    assert "Polling timeout reached" in result.output
+    assert sum(call.args[0] for call in mock_sleep.call_args_list) == 1200
+    assert max(call.args[0] for call in mock_sleep.call_args_list) == 60
+
+
 def test_target_validation(runner):
     """Test target option validation."""
     result = runner.invoke(cli, ["status", "--branch", "main", "--commit", "abc123"])
 
     assert result.exit_code == 1
     assert "Please specify only one of --branch, --commit, or --pr" in result.output
+
+
+def test_cli_import_defers_network_dependencies():
+    """Test that loading the CLI (e.g. for --help) doesn't import requests or GitPython."""
+    code = (
+        "import sys, cimonitor.cli; "
+        "print(sorted(m for m in ('requests', 'git', 'sqlite3') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
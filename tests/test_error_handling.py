@@ -1,11 +1,13 @@
 """Tests for improved error handling specificity."""
 
+from datetime import datetime
 from unittest.mock import Mock, patch
 
 from cimonitor.services import (
     _calculate_step_duration,
     _calculate_workflow_duration,
     _extract_run_id_from_url,
+    _parse_github_timestamp,
     _process_check_run_for_logs,
     get_job_details_for_status,
 )
@@ -73,7 +75,7 @@ class TestErrorHandlingSpecificity:
         assert result.endswith("s")
         assert result != "unknown"
 
-    @patch("cimonitor.services.GitHubCIFetcher")
+    @patch("cimonitor.fetcher.GitHubCIFetcher")
     def test_get_job_details_error_handling(self, mock_fetcher_class):
         """Test that get_job_details_for_status handles API errors gracefully."""
         mock_fetcher = Mock()
@@ -158,3 +160,33 @@ class TestErrorHandlingRegression:
         # Valid workflow duration
         valid_run = {"created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-01T10:02:00Z"}
         assert _calculate_workflow_duration(valid_run) == "120s"
+
+
+class TestParseGithubTimestamp:
+    """Test the fast path and fallback of GitHub timestamp parsing."""
+
+    def test_fast_path_matches_fromisoformat(self):
+        """Test that sliced parsing agrees with datetime for the API's format."""
+        for value in ["2025-01-01T10:00:00Z", "2024-02-29T23:59:59Z", "1999-12-31T00:00:01Z"]:
+            expected = datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+            assert _parse_github_timestamp(value) == expected
+
+    def test_fallback_handles_offsets_and_fractions(self):
+        """Test that non-canonical ISO timestamps still parse."""
+        assert _parse_github_timestamp("2025-01-01T12:00:00+02:00") == _parse_github_timestamp(
+            "2025-01-01T10:00:00Z"
+        )
+        assert _parse_github_timestamp("2025-01-01T10:00:00.500+00:00") == (
+            _parse_github_timestamp("2025-01-01T10:00:00Z") + 0.5
+        )
+
+    def test_repeated_timestamps_are_memoized(self):
+        """Test that polling the same run timestamps reuses earlier parses."""
+        _parse_github_timestamp.cache_clear()
+        run = {"created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-01T10:02:00Z"}
+
+        for _ in range(3):
+            assert _calculate_workflow_duration(run) == "120s"
+
+        assert _parse_github_timestamp.cache_info().misses == 2
+        assert _parse_github_timestamp.cache_info().hits == 4
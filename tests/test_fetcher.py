@@ -1,8 +1,10 @@
 """Tests for the CI Monitor fetcher functionality."""
 
+import json
 from unittest.mock import patch
 
 import pytest
+import requests
 
 from cimonitor.fetcher import GitHubCIFetcher
 
@@ -12,6 +14,9 @@ def test_github_ci_fetcher_init_with_token():
     fetcher = GitHubCIFetcher("test_token")
     assert fetcher.github_token == "test_token"
     assert fetcher.headers["Authorization"] == "token test_token"
+    assert fetcher.session.headers["Authorization"] == "token test_token"
+    assert fetcher.session.headers["Accept"] == "application/vnd.github+json"
+    assert fetcher.session.headers["User-Agent"].startswith("cimonitor")
 
 
 def test_github_ci_fetcher_init_without_token():
@@ -57,3 +62,376 @@ def test_get_failed_steps():
     assert failed_steps[0]["name"] == "Failing Step"
     assert failed_steps[0]["number"] == 2
     assert failed_steps[0]["conclusion"] == "failure"
+
+
+@patch("requests.Session.get")
+def test_get_job_logs_decodes_streamed_chunks(mock_get):
+    """Test that streamed log chunks are decoded, including multi-byte characters split across chunks."""
+    fetcher = GitHubCIFetcher("test_token")
+    body = "step ❌ failed\n".encode()
+    mock_get.return_value.encoding = None
+    mock_get.return_value.iter_content.return_value = [body[:6], body[6:]]
+
+    assert fetcher.get_job_logs("owner", "repo", 123) == "step ❌ failed\n"
+    assert mock_get.call_args.kwargs["stream"] is True
+    mock_get.return_value.close.assert_called_once()
+
+
+@patch("requests.Session.get")
+def test_get_job_logs_downloads_each_job_once(mock_get):
+    """Test that repeated requests for one job's logs reuse the first download."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_get.return_value.encoding = "utf-8"
+    mock_get.return_value.iter_content.return_value = [b"job logs"]
+
+    assert fetcher.get_job_logs("owner", "repo", 123) == "job logs"
+    assert fetcher.get_job_logs("owner", "repo", 123) == "job logs"
+    assert "".join(fetcher.iter_job_logs("owner", "repo", 123)) == "job logs"
+
+    assert mock_get.call_count == 1
+
+
+@patch("requests.Session.get")
+def test_iter_job_logs_yields_chunks_as_they_arrive(mock_get):
+    """Test that job logs can be consumed chunk by chunk, and that failures raise."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_get.return_value.encoding = "utf-8"
+    mock_get.return_value.iter_content.return_value = [b"first ", b"second"]
+
+    assert list(fetcher.iter_job_logs("owner", "repo", 123)) == ["first ", "second"]
+    mock_get.return_value.close.assert_called_once()
+
+    mock_get.return_value.raise_for_status.side_effect = requests.HTTPError("404")
+    with pytest.raises(ValueError, match="Failed to fetch logs for job 123"):
+        list(fetcher.iter_job_logs("owner", "repo", 123))
+
+
+@pytest.mark.parametrize(
+    "origin_url, expected",
+    [
+        ("git@github.com:owner/repo.git", ("owner", "repo")),
+        ("git@github.com:owner/repo", ("owner", "repo")),
+        ("https://github.com/owner/repo.git", ("owner", "repo")),
+        ("https://github.com/owner/repo/", ("owner", "repo")),
+        ("ssh://git@github.com/owner/repo.git", ("owner", "repo")),
+        ("https://github.com/owner/owner.github.io.git", ("owner", "owner.github.io")),
+    ],
+)
+@patch("git.Repo")
+def test_get_repo_info_remote_formats(mock_repo_class, origin_url, expected):
+    """Test that SSH and URL remotes are parsed, keeping dots in repository names."""
+    mock_repo_class.return_value.remotes.origin.url = origin_url
+
+    assert GitHubCIFetcher("test_token").get_repo_info() == expected
+
+
+@patch("git.Repo")
+def test_get_repo_info_unparseable_remote(mock_repo_class):
+    """Test that a remote without owner/repo raises ValueError."""
+    mock_repo_class.return_value.remotes.origin.url = "https://github.com/owner"
+
+    with pytest.raises(ValueError, match="Could not parse repository info"):
+        GitHubCIFetcher("test_token").get_repo_info()
+
+
+@patch("git.Repo")
+def test_repo_is_opened_once(mock_repo_class):
+    """Test that the git repository and remote info are only loaded once per fetcher."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_repo = mock_repo_class.return_value
+    mock_repo.remotes.origin.url = "git@github.com:owner/repo.git"
+    mock_repo.head.is_detached = False
+    mock_repo.active_branch.name = "main"
+    mock_repo.head.commit.hexsha = "a" * 40
+
+    assert fetcher.get_repo_info() == ("owner", "repo")
+    assert fetcher.get_repo_info() == ("owner", "repo")
+    assert fetcher.get_current_branch_and_commit() == ("main", "a" * 40)
+
+    mock_repo_class.assert_called_once_with(".")
+
+
+@patch("requests.Session.post")
+def test_fetch_failure_tree(mock_post):
+    """Test converting the GraphQL failure tree into REST-shaped check runs."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_post.return_value.content = json.dumps(
+        {
+            "data": {
+                "repository": {
+                    "object": {
+                        "checkSuites": {
+                            "nodes": [
+                                {
+                                    "app": {"slug": "github-actions"},
+                                    "checkRuns": {
+                                        "nodes": [
+                                            {
+                                                "databaseId": 789,
+                                                "name": "test",
+                                                "conclusion": "FAILURE",
+                                                "url": "https://github.com/owner/repo/runs/789",
+                                                "detailsUrl": "https://github.com/owner/repo/actions/runs/123/job/789",
+                                                "steps": {
+                                                    "nodes": [
+                                                        {
+                                                            "name": "Run tests",
+                                                            "number": 2,
+                                                            "status": "COMPLETED",
+                                                            "conclusion": "FAILURE",
+                                                            "startedAt": "2025-01-01T10:00:00Z",
+                                                            "completedAt": "2025-01-01T10:00:30Z",
+                                                        }
+                                                    ]
+                                                },
+                                            }
+                                        ]
+                                    },
+                                },
+                                {
+                                    "app": {"slug": "external-ci"},
+                                    "checkRuns": {
+                                        "nodes": [
+                                            {
+                                                "databaseId": 555,
+                                                "name": "external",
+                                                "conclusion": "FAILURE",
+                                                "url": "https://github.com/owner/repo/runs/555",
+                                                "detailsUrl": "https://ci.example.com/555",
+                                                "steps": {"nodes": []},
+                                            }
+                                        ]
+                                    },
+                                },
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    ).encode()
+
+    check_runs = fetcher.fetch_failure_tree("owner", "repo", "abc123")
+
+    assert check_runs == [
+        {
+            "id": 789,
+            "name": "test",
+            "conclusion": "failure",
+            "html_url": "https://github.com/owner/repo/actions/runs/123/job/789",
+            "steps": [
+                {
+                    "name": "Run tests",
+                    "number": 2,
+                    "status": "completed",
+                    "conclusion": "failure",
+                    "started_at": "2025-01-01T10:00:00Z",
+                    "completed_at": "2025-01-01T10:00:30Z",
+                }
+            ],
+        },
+        {
+            "id": 555,
+            "name": "external",
+            "conclusion": "failure",
+            "html_url": "https://github.com/owner/repo/runs/555",
+        },
+    ]
+
+
+@patch("requests.Session.post")
+def test_fetch_failure_tree_graphql_errors(mock_post):
+    """Test that GraphQL errors are raised as ValueError."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_post.return_value.content = b'{"errors": [{"message": "Bad credentials"}]}'
+
+    with pytest.raises(ValueError, match="Bad credentials"):
+        fetcher.fetch_failure_tree("owner", "repo", "abc123")
+
+
+@patch("requests.Session.post")
+def test_fetch_failure_tree_truncated_check_runs(mock_post):
+    """Test that a truncated page of failed check runs raises so callers can use REST."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_post.return_value.content = json.dumps(
+        {
+            "data": {
+                "repository": {
+                    "object": {
+                        "checkSuites": {
+                            "pageInfo": {"hasNextPage": False},
+                            "nodes": [
+                                {
+                                    "app": {"slug": "github-actions"},
+                                    "checkRuns": {"pageInfo": {"hasNextPage": True}, "nodes": []},
+                                }
+                            ],
+                        }
+                    }
+                }
+            }
+        }
+    ).encode()
+
+    with pytest.raises(ValueError, match="Too many failed check runs"):
+        fetcher.fetch_failure_tree("owner", "repo", "abc123")
+
+    query = mock_post.call_args.kwargs["json"]["query"]
+    assert "checkType: LATEST" in query
+
+
+@patch("requests.Session.post")
+def test_fetch_failure_tree_truncated_steps(mock_post):
+    """Test that a run whose steps were truncated is returned without steps."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_post.return_value.content = json.dumps(
+        {
+            "data": {
+                "repository": {
+                    "object": {
+                        "checkSuites": {
+                            "nodes": [
+                                {
+                                    "app": {"slug": "github-actions"},
+                                    "checkRuns": {
+                                        "nodes": [
+                                            {
+                                                "databaseId": 789,
+                                                "name": "test",
+                                                "conclusion": "FAILURE",
+                                                "detailsUrl": "https://github.com/owner/repo/actions/runs/123/job/789",
+                                                "steps": {
+                                                    "pageInfo": {"hasNextPage": True},
+                                                    "nodes": [{"name": "Set up job"}],
+                                                },
+                                            }
+                                        ]
+                                    },
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    ).encode()
+
+    assert fetcher.fetch_failure_tree("owner", "repo", "abc123") == [
+        {
+            "id": 789,
+            "name": "test",
+            "conclusion": "failure",
+            "html_url": "https://github.com/owner/repo/actions/runs/123/job/789",
+        }
+    ]
+
+
+@patch("requests.Session.get")
+def test_get_all_jobs_for_commit_uses_check_runs(mock_get):
+    """Test that jobs come from one check-runs request narrowed to completed Actions runs."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.headers = {}
+    mock_get.return_value.content = json.dumps(
+        {
+            "check_runs": [
+                {"id": 1, "name": "build", "conclusion": "success"},
+                {"id": 2, "name": "test", "conclusion": "failure"},
+            ]
+        }
+    ).encode()
+
+    failed_jobs = fetcher.get_all_jobs_for_commit(
+        "owner", "repo", "abc123", conclusion_filter="failure"
+    )
+
+    assert failed_jobs == [{"id": 2, "name": "test", "conclusion": "failure"}]
+    assert mock_get.call_count == 1
+    assert mock_get.call_args.args == (
+        "https://api.github.com/repos/owner/repo/commits/abc123/check-runs",
+    )
+    params = mock_get.call_args.kwargs["params"]
+    assert params["status"] == "completed"
+    assert params["app_id"] == 15368
+
+
+@patch("requests.Session.get")
+def test_get_all_jobs_for_commit_follows_pages(mock_get):
+    """Test that check runs beyond the first page of 100 are fetched too."""
+    fetcher = GitHubCIFetcher("test_token")
+    pages = [
+        [{"id": i, "conclusion": "failure" if i in (7, 142) else "success"} for i in ids]
+        for ids in (range(100), range(100, 150))
+    ]
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.headers = {}
+
+    def respond(url, params, **kwargs):
+        page = pages[params["page"] - 1]
+        mock_get.return_value.content = json.dumps(
+            {"total_count": 150, "check_runs": page}
+        ).encode()
+        return mock_get.return_value
+
+    mock_get.side_effect = respond
+
+    failed_jobs = fetcher.get_all_jobs_for_commit(
+        "owner", "repo", "abc123", conclusion_filter="failure"
+    )
+
+    assert [job["id"] for job in failed_jobs] == [7, 142]
+    assert [call.kwargs["params"]["page"] for call in mock_get.call_args_list] == [1, 2]
+
+
+@patch("requests.Session.get")
+def test_get_workflow_runs_for_commit_keeps_used_fields(mock_get):
+    """Test that workflow runs are projected to the fields cimonitor reads."""
+    fetcher = GitHubCIFetcher("test_token")
+    run = {
+        "id": 1,
+        "name": "CI",
+        "status": "completed",
+        "conclusion": "success",
+        "created_at": "2025-01-01T10:00:00Z",
+        "updated_at": "2025-01-01T10:05:00Z",
+        "html_url": "https://github.com/owner/repo/actions/runs/1",
+    }
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.headers = {}
+    mock_get.return_value.content = json.dumps(
+        {"workflow_runs": [{**run, "actor": {"login": "someone"}, "head_commit": {}}]}
+    ).encode()
+
+    assert fetcher.get_workflow_runs_for_commit("owner", "repo", "abc123") == [run]
+
+
+@patch("requests.Session.post")
+def test_rerun_failed_jobs_failure_prints_nothing(mock_post, capsys):
+    """Test that a failed rerun is reported through the return value, not stdout."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_post.return_value.raise_for_status.side_effect = requests.HTTPError("403 Forbidden")
+
+    assert fetcher.rerun_failed_jobs("owner", "repo", 123) is False
+    assert capsys.readouterr().out == ""
+
+
+@patch("requests.Session.get")
+def test_get_workflow_jobs_follows_pages(mock_get):
+    """Test that a run's jobs are listed 100 per page until total_count is reached."""
+    fetcher = GitHubCIFetcher("test_token")
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.headers = {}
+
+    def respond(url, params, **kwargs):
+        start = (params["page"] - 1) * params["per_page"]
+        jobs = [{"id": i} for i in range(start, min(start + params["per_page"], 130))]
+        mock_get.return_value.content = json.dumps({"total_count": 130, "jobs": jobs}).encode()
+        return mock_get.return_value
+
+    mock_get.side_effect = respond
+
+    jobs = fetcher.get_workflow_jobs("owner", "repo", 123)
+
+    assert [job["id"] for job in jobs] == list(range(130))
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["params"] == {"per_page": 100, "page": 2}
@@ -1,5 +1,7 @@
 """Tests for the log parser functionality."""
 
+from collections import deque
+
 from cimonitor.log_parser import LogParser
 
 
@@ -17,7 +19,7 @@ def test_filter_error_lines():
 2025-07-13T04:07:49.4818415Z ##[error]Process completed with exit code 1.
 2025-07-13T04:07:49.4934884Z Post job cleanup."""
 
-    error_lines = LogParser.filter_error_lines(step_log)
+    error_lines, _ = LogParser.filter_error_lines_with_tail(step_log.split("\n"))
 
     # Should include group markers, error lines, and other important markers
     assert any("##[group]Run echo" in line for line in error_lines)
@@ -32,7 +34,7 @@ def test_filter_error_lines():
     assert len(error_lines) >= 4
 
 
-def test_extract_step_logs():
+def test_extract_step_lines():
     """Test extracting logs for specific failed steps with exact name matching."""
     # This is based on actual GitHub Actions log data
     full_logs = """2025-07-13T04:07:48.8923897Z ##[group]Run actions/checkout@v4
@@ -62,10 +64,12 @@ def test_extract_step_logs():
         }
     ]
 
-    step_logs = LogParser.extract_step_logs(full_logs, failed_steps)
+    step_lines = LogParser.extract_step_lines(full_logs.split("\n"), failed_steps)
 
-    assert 'echo "This step will fail intentionally to test CI log fetching"' in step_logs
-    failing_log = step_logs['echo "This step will fail intentionally to test CI log fetching"']
+    assert 'echo "This step will fail intentionally to test CI log fetching"' in step_lines
+    failing_log = "\n".join(
+        step_lines['echo "This step will fail intentionally to test CI log fetching"']
+    )
 
     # Should include the step content and error context after endgroup
     assert (
@@ -80,7 +84,7 @@ def test_extract_step_logs():
     assert "Run actions/checkout@v4" not in failing_log
 
 
-def test_extract_step_logs_fallback_when_no_match():
+def test_extract_step_lines_fallback_when_no_match():
     """Test that step extraction returns empty dict when no exact match is found."""
     # Real scenario where step name doesn't exactly match the ##[group]Run line
     full_logs = """2025-07-13T04:07:49.4696757Z ##[group]Run echo "This step will fail intentionally to test CI log fetching"
@@ -100,7 +104,78 @@ def test_extract_step_logs_fallback_when_no_match():
         }
     ]
 
-    step_logs = LogParser.extract_step_logs(full_logs, failed_steps)
+    step_lines = LogParser.extract_step_lines(full_logs.split("\n"), failed_steps)
 
     # Should return empty dict when no exact match is found (deterministic behavior)
-    assert step_logs == {}
+    assert step_lines == {}
+
+
+def test_filter_error_lines_matches_keywords_case_insensitively():
+    """Test that error keywords match regardless of case and position."""
+    step_log = """2025-07-13T04:07:49.4696757Z Compiling module
+2025-07-13T04:07:49.4697730Z Build FAILED after 3 attempts
+2025-07-13T04:07:49.4698562Z Test Failure: test_widget
+2025-07-13T04:07:49.4699162Z Process exited with Exit Code 2
+2025-07-13T04:07:49.4731808Z ✗ lint"""
+
+    error_lines, _ = LogParser.filter_error_lines_with_tail(step_log.split("\n"))
+
+    assert not any("Compiling module" in line for line in error_lines)
+    assert len(error_lines) == 4
+
+
+def test_extract_step_lines_multiple_steps():
+    """Test that each failed step is matched to its own group from a single marker index."""
+    full_logs = """2025-07-13T04:07:48.0000000Z ##[group]Run make lint
+2025-07-13T04:07:48.1000000Z lint output
+2025-07-13T04:07:48.2000000Z ##[endgroup]
+2025-07-13T04:07:48.3000000Z ##[error]lint failed
+2025-07-13T04:07:49.0000000Z ##[group]Run make test
+2025-07-13T04:07:49.1000000Z test output
+2025-07-13T04:07:49.2000000Z ##[endgroup]
+2025-07-13T04:07:49.3000000Z ##[error]tests failed"""
+
+    failed_steps = [{"name": "make test", "number": 3}, {"name": "make lint", "number": 2}]
+
+    step_lines = LogParser.extract_step_lines(full_logs.split("\n"), failed_steps)
+    test_log = "\n".join(step_lines["make test"])
+    lint_log = "\n".join(step_lines["make lint"])
+
+    assert "test output" in test_log
+    assert "lint output" not in test_log
+    assert "lint output" in lint_log
+    assert "##[error]lint failed" in lint_log
+
+
+def test_filter_error_lines_ignores_timestamped_lines_in_any_year():
+    """Test that timestamped noise is filtered regardless of the year."""
+    step_log = """2026-03-01T04:07:49.4696757Z Downloading dependencies
+2031-03-01T04:07:49.4697730Z Resolving packages
+2026-03-01T04:07:49.4698562Z ##[error]Process completed with exit code 1.
+plain command output"""
+
+    error_lines, _ = LogParser.filter_error_lines_with_tail(step_log.split("\n"))
+
+    assert error_lines == [
+        "2026-03-01T04:07:49.4698562Z ##[error]Process completed with exit code 1.",
+        "plain command output",
+    ]
+
+
+def test_filter_error_lines_with_tail():
+    """Test that matches and the fallback tail come out of a single pass."""
+    step_lines = [f"2025-07-13T04:07:4{i}.0000000Z progress {i}" for i in range(5)]
+    step_lines.insert(2, "")
+
+    shown_lines, tail = LogParser.filter_error_lines_with_tail(step_lines, tail_size=3)
+
+    assert shown_lines == []
+    assert list(tail) == [
+        "2025-07-13T04:07:42.0000000Z progress 2",
+        "2025-07-13T04:07:43.0000000Z progress 3",
+        "2025-07-13T04:07:44.0000000Z progress 4",
+    ]
+
+    shown_lines, tail = LogParser.filter_error_lines_with_tail(["", "##[error]boom"])
+    assert shown_lines == ["##[error]boom"]
+    assert LogParser.filter_error_lines_with_tail(["", "  "]) == ([], deque())
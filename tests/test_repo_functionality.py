@@ -160,3 +160,15 @@ class TestGetTargetInfoWithRepo:
         assert pr_number == 1
         mock_fetcher.get_repo_info.assert_called_once()
         mock_fetcher.get_pr_head_sha.assert_called_once_with("current", "repo", 1)
+
+    def test_get_target_info_verbose_json_keeps_stdout_clean(self, capsys):
+        """Test that verbose details go to stderr when output is JSON."""
+        mock_fetcher = Mock()
+        mock_fetcher.get_branch_head_sha.return_value = "def456"
+
+        get_target_info(mock_fetcher, "test/repo", "main", None, None, True, as_json=True)
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "Repository: test/repo" in captured.err
+        assert "Head commit: def456" in captured.err
@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from cimonitor.fetcher import GitHubCIFetcher
 from cimonitor.services import (
     CIStatusResult,
     JobDetails,
@@ -59,7 +60,7 @@ def test_job_details():
 def test_get_ci_status(mock_fetcher):
     """Test get_ci_status function."""
     failed_runs = [{"name": "test", "conclusion": "failure"}]
-    mock_fetcher.find_failed_jobs_in_latest_run.return_value = failed_runs
+    mock_fetcher.fetch_failure_tree.return_value = failed_runs
 
     result = get_ci_status(mock_fetcher, "owner", "repo", "abc123", "test branch")
 
@@ -68,7 +69,28 @@ def test_get_ci_status(mock_fetcher):
     assert result.target_description == "test branch"
     assert result.has_failures is True
 
-    mock_fetcher.find_failed_jobs_in_latest_run.assert_called_once_with("owner", "repo", "abc123")
+    mock_fetcher.fetch_failure_tree.assert_called_once_with("owner", "repo", "abc123")
+    mock_fetcher.get_all_workflow_runs_for_commit.assert_not_called()
+
+
+def test_get_ci_status_falls_back_to_rest(mock_fetcher):
+    """Test get_ci_status lists failed workflow jobs over REST when GraphQL fails."""
+    failed_job = {"id": 7, "name": "test", "conclusion": "failure", "steps": []}
+    mock_fetcher.fetch_failure_tree.side_effect = ValueError("GraphQL query failed")
+    mock_fetcher.get_all_workflow_runs_for_commit.return_value = [
+        {"id": 1, "conclusion": "success"},
+        {"id": 2, "conclusion": "failure"},
+    ]
+    mock_fetcher.get_workflow_jobs.return_value = [
+        {"id": 6, "name": "lint", "conclusion": "success", "steps": []},
+        failed_job,
+    ]
+
+    result = get_ci_status(mock_fetcher, "owner", "repo", "abc123", "test branch")
+
+    assert result.failed_check_runs == [failed_job]
+    # The successful run is never asked for its jobs
+    mock_fetcher.get_workflow_jobs.assert_called_once_with("owner", "repo", 2)
 
 
 def test_get_job_details_for_status_basic(mock_fetcher):
@@ -130,19 +152,69 @@ def test_get_job_details_for_status_with_workflow(mock_fetcher):
     assert result.failed_steps[0].duration == "60.0s"
 
 
+def test_get_job_details_for_status_with_steps_skips_jobs_request():
+    """Test that check runs carrying their steps need no further API calls."""
+    fetcher = Mock(wraps=GitHubCIFetcher("test_token"))
+    check_run = {
+        "id": 789,
+        "name": "Test Job",
+        "conclusion": "failure",
+        "html_url": "https://github.com/owner/repo/actions/runs/123456/job/789",
+        "steps": [
+            {"name": "Checkout", "number": 1, "conclusion": "success"},
+            {
+                "name": "Run tests",
+                "number": 2,
+                "conclusion": "failure",
+                "started_at": "2025-01-01T10:00:00Z",
+                "completed_at": "2025-01-01T10:00:30Z",
+            },
+        ],
+    }
+
+    result = get_job_details_for_status(fetcher, "owner", "repo", check_run)
+
+    assert [(step.name, step.number, step.duration) for step in result.failed_steps] == [
+        ("Run tests", 2, "30.0s")
+    ]
+    fetcher.get_workflow_jobs.assert_not_called()
+
+
+def test_get_job_details_for_status_truncated_steps(mock_fetcher):
+    """Test that a check run whose steps were truncated reports only its own job's steps."""
+    check_run = {
+        "id": 2,
+        "name": "test (3.11)",
+        "conclusion": "failure",
+        "html_url": "https://github.com/owner/repo/actions/runs/123/job/2",
+    }
+    mock_fetcher.get_workflow_jobs.return_value = [
+        {"id": job_id, "conclusion": "failure", "steps": []} for job_id in (1, 2)
+    ]
+    mock_fetcher.get_failed_steps.side_effect = lambda job: [
+        {"name": f"Step of job {job['id']}", "number": 1}
+    ]
+
+    result = get_job_details_for_status(mock_fetcher, "owner", "repo", check_run)
+
+    assert [step.name for step in result.failed_steps] == ["Step of job 2"]
+    mock_fetcher.get_workflow_jobs.assert_called_once_with("owner", "repo", 123)
+
+
 def test_get_job_logs_specific_job(mock_fetcher):
     """Test get_job_logs with specific job ID."""
     job_info = {"id": 123, "name": "Test Job", "conclusion": "failure"}
-    logs = "test log content"
 
     mock_fetcher.get_job_by_id.return_value = job_info
-    mock_fetcher.get_job_logs.return_value = logs
+    mock_fetcher.iter_job_logs.return_value = iter(["test log ", "content"])
 
     result = get_job_logs(mock_fetcher, "owner", "repo", "abc123", "test", job_id=123)
 
     assert result["type"] == "specific_job"
     assert result["job_info"] == job_info
-    assert result["logs"] == logs
+    assert "".join(result["logs"]) == "test log content"
+    mock_fetcher.iter_job_logs.assert_called_once_with("owner", "repo", 123)
+    mock_fetcher.get_job_logs.assert_not_called()
 
 
 def test_get_job_logs_raw(mock_fetcher):
@@ -156,18 +228,36 @@ def test_get_job_logs_raw(mock_fetcher):
 
     assert result["type"] == "raw_logs"
     assert result["has_failures"] is True
+    mock_fetcher.get_all_jobs_for_commit.assert_called_once_with(
+        "owner", "repo", "abc123", conclusion_filter="failure"
+    )
     assert len(result["failed_jobs"]) == 1
     assert result["failed_jobs"][0]["job"] == failed_jobs[0]
     assert result["failed_jobs"][0]["logs"] == "test logs"
 
 
+def test_get_job_logs_raw_keeps_job_order(mock_fetcher):
+    """Test that concurrently downloaded raw logs stay paired with their jobs."""
+    failed_jobs = [{"id": i, "name": f"Job {i}", "conclusion": "failure"} for i in range(1, 6)]
+    failed_jobs.append({"name": "No ID", "conclusion": "failure"})
+
+    mock_fetcher.get_all_jobs_for_commit.return_value = failed_jobs
+    mock_fetcher.get_job_logs.side_effect = lambda owner, repo, job_id: f"logs {job_id}"
+
+    result = get_job_logs(mock_fetcher, "owner", "repo", "abc123", "test", raw=True)
+
+    assert [(job_log["job"]["id"], job_log["logs"]) for job_log in result["failed_jobs"]] == [
+        (i, f"logs {i}") for i in range(1, 6)
+    ]
+
+
 def test_get_job_logs_filtered(mock_fetcher):
     """Test get_job_logs with filtered output."""
     failed_runs = [
         {"name": "Test Job", "html_url": "https://github.com/owner/repo/actions/runs/123"}
     ]
 
-    mock_fetcher.find_failed_jobs_in_latest_run.return_value = failed_runs
+    mock_fetcher.fetch_failure_tree.return_value = failed_runs
     mock_fetcher.get_workflow_jobs.return_value = []
 
     result = get_job_logs(mock_fetcher, "owner", "repo", "abc123", "test")
@@ -177,6 +267,69 @@ def test_get_job_logs_filtered(mock_fetcher):
     assert result["has_failures"] is True
 
 
+def test_get_job_logs_filtered_preserves_check_run_order(mock_fetcher):
+    """Test that concurrently processed check runs are reported in their original order."""
+    failed_runs = [
+        {"name": f"Job {i}", "html_url": f"https://github.com/owner/repo/actions/runs/{i}"}
+        for i in range(1, 6)
+    ]
+
+    mock_fetcher.fetch_failure_tree.return_value = failed_runs
+    mock_fetcher.get_workflow_jobs.return_value = []
+
+    result = get_job_logs(mock_fetcher, "owner", "repo", "abc123", "test")
+
+    assert [job["name"] for job in result["failed_jobs"]] == [f"Job {i}" for i in range(1, 6)]
+    assert mock_fetcher.get_workflow_jobs.call_count == 5
+
+
+def test_get_job_logs_filtered_fetches_each_jobs_own_logs(mock_fetcher):
+    """Test that failing jobs sharing a workflow run each download only their own logs."""
+    run_url = "https://github.com/owner/repo/actions/runs/123"
+    failed_runs = [
+        {"id": 1, "name": "test (3.10)", "html_url": f"{run_url}/job/1"},
+        {"id": 2, "name": "test (3.11)", "html_url": f"{run_url}/job/2"},
+    ]
+    jobs = [
+        {"id": job_id, "name": name, "conclusion": "failure", "steps": []}
+        for job_id, name in [(1, "test (3.10)"), (2, "test (3.11)")]
+    ]
+
+    mock_fetcher.fetch_failure_tree.return_value = failed_runs
+    mock_fetcher.get_workflow_jobs.return_value = jobs
+    mock_fetcher.get_failed_steps.return_value = [{"name": "Run tests", "number": 1}]
+    mock_fetcher.get_job_logs.return_value = "logs"
+
+    result = get_job_logs(mock_fetcher, "owner", "repo", "abc123", "test")
+
+    assert [job["job_name"] for job in result["failed_jobs"]] == ["test (3.10)", "test (3.11)"]
+    fetched_job_ids = sorted(call.args[2] for call in mock_fetcher.get_job_logs.call_args_list)
+    assert fetched_job_ids == [1, 2]
+
+
+def test_get_job_logs_filtered_uses_steps_from_failure_tree(mock_fetcher):
+    """Test that check runs carrying steps fetch logs without a jobs request."""
+    failed_runs = [
+        {
+            "id": 789,
+            "name": "test",
+            "conclusion": "failure",
+            "html_url": "https://github.com/owner/repo/actions/runs/123/job/789",
+            "steps": [{"name": "Run tests", "number": 2, "conclusion": "failure"}],
+        }
+    ]
+
+    mock_fetcher.fetch_failure_tree.return_value = failed_runs
+    mock_fetcher.get_failed_steps.return_value = [{"name": "Run tests", "number": 2}]
+    mock_fetcher.get_job_logs.return_value = "logs"
+
+    result = get_job_logs(mock_fetcher, "owner", "repo", "abc123", "test")
+
+    assert result["failed_jobs"][0]["job_name"] == "test"
+    mock_fetcher.get_workflow_jobs.assert_not_called()
+    mock_fetcher.get_job_logs.assert_called_once_with("owner", "repo", 789)
+
+
 def test_watch_ci_status_no_runs(mock_fetcher):
     """Test watch_ci_status with no workflow runs."""
     mock_fetcher.get_workflow_runs_for_commit.return_value = []
@@ -253,6 +406,20 @@ def test_watch_ci_status_in_progress(mock_fetcher):
     assert result["status"] == "in_progress"
     assert result["continue_watching"] is True
     assert result["workflows"][0]["emoji"] == "🔄"
+    assert result["last_updated"] == "2025-01-01T10:02:00Z"
+
+
+def test_watch_ci_status_reports_latest_update(mock_fetcher):
+    """Test that the most recent updated_at across runs is reported."""
+    mock_fetcher.get_workflow_runs_for_commit.return_value = [
+        {"name": "A", "status": "in_progress", "updated_at": "2025-01-01T10:02:00Z"},
+        {"name": "B", "status": "queued", "updated_at": "2025-01-01T10:07:00Z"},
+        {"name": "C", "status": "queued"},
+    ]
+
+    result = watch_ci_status(mock_fetcher, "owner", "repo", "abc123", "test")
+
+    assert result["last_updated"] == "2025-01-01T10:07:00Z"
 
 
 def test_watch_ci_status_until_fail(mock_fetcher):
@@ -300,7 +467,8 @@ def test_watch_ci_status_retry_needed(mock_fetcher):
 
 def test_retry_failed_workflows(mock_fetcher):
     """Test retry_failed_workflows function."""
-    mock_fetcher.rerun_failed_jobs.side_effect = [True, False]
+    # Reruns are sent concurrently, so answer by run ID rather than call order
+    mock_fetcher.rerun_failed_jobs.side_effect = lambda owner, repo, run_id: run_id == 123
 
     result = retry_failed_workflows(mock_fetcher, "owner", "repo", [123, 456])
 
@@ -356,3 +524,46 @@ def test_extract_run_id_from_url():
 
     # Test malformed URL
     assert _extract_run_id_from_url("https://github.com/actions/runs/invalid") is None
+
+
+@pytest.mark.parametrize(
+    ("status", "conclusion", "expected"),
+    [
+        ("completed", "success", ("✅", True, False)),
+        ("completed", "failure", ("❌", True, True)),
+        ("completed", "cancelled", ("🚫", True, True)),
+        ("completed", "timed_out", ("⚠️", True, True)),
+        ("completed", None, ("⚠️", True, True)),
+        ("in_progress", None, ("🔄", False, False)),
+        ("queued", None, ("⏳", False, False)),
+        ("waiting", None, ("❓", False, False)),
+    ],
+)
+def test_process_single_workflow_run_status_table(status, conclusion, expected):
+    """Test the emoji and completed/failed flags for each run status."""
+    from cimonitor.services import _process_single_workflow_run
+
+    info = _process_single_workflow_run({"status": status, "conclusion": conclusion})
+
+    assert (info["emoji"], info["completed"], info["failed"]) == expected
+
+
+def test_remove_timestamps():
+    """Test that only leading GitHub timestamps are stripped from each line."""
+    from cimonitor.services import _remove_timestamps
+
+    logs = (
+        "2025-07-16T03:13:13.5152643Z ##[group]Run make test\n"
+        "2031-01-02T00:00:00Z FAILED test_thing\n"
+        "plain output 2025-07-16T03:13:13Z stays\n"
+        "2025 Tests Zone is not a timestamp\n"
+        "2025-07-16T03:13:13.5152643Z"
+    )
+
+    assert _remove_timestamps(logs) == (
+        "##[group]Run make test\n"
+        "FAILED test_thing\n"
+        "plain output 2025-07-16T03:13:13Z stays\n"
+        "2025 Tests Zone is not a timestamp\n"
+        "2025-07-16T03:13:13.5152643Z"
+    )
@@ -1,85 +1,82 @@
 """Tests for URL parsing robustness improvements."""
 
-from cimonitor.services import _extract_run_id_from_url
+import pytest
+
+from cimonitor.services import _cached_extract, _extract_run_id_from_url
+
+# (url, expected run ID) for the run ID extraction tests
+_CASES = (
+    pytest.param(
+        "https://github.com/owner/repo/actions/runs/123456/jobs/789", 123456, id="standard"
+    ),
+    pytest.param("https://github.com/owner/repo/actions/runs/987654", 987654, id="without-job-id"),
+    pytest.param(
+        "https://github.com/owner/repo/actions/runs/555555?check_suite_focus=true",
+        555555,
+        id="query-params",
+    ),
+    pytest.param(
+        "https://github.com/owner/repo/actions/runs/111111#step:1:1", 111111, id="fragment"
+    ),
+    pytest.param("", None, id="empty-string"),
+    pytest.param(None, None, id="none"),
+    pytest.param("https://github.com/owner/repo/issues/123", None, id="no-actions-runs"),
+    # Would break the old split() method
+    pytest.param("https://github.com/owner/repo/actions/runs/", None, id="malformed"),
+    pytest.param("https://github.com/owner/repo/actions/runs/not-a-number", None, id="non-numeric"),
+    # Contrived, but the run ID must follow the actions/runs segment
+    pytest.param("https://github.com/runs/repo/actions/runs/123456", 123456, id="multiple-runs"),
+    pytest.param("https://github.com/owner/repo/actions/runs", None, id="runs-at-end"),
+    pytest.param("not-a-url-at-all", None, id="invalid-format"),
+    pytest.param("https://actions-runs.example.com/some/path", None, id="actions-runs-in-domain"),
+    # The run ID must be a whole path segment
+    pytest.param(
+        "https://github.com/owner/repo/actions/runs/123abc/jobs/789",
+        None,
+        id="run-id-with-trailing-text",
+    ),
+    # A run path in the query string or fragment is not the page's run
+    pytest.param(
+        "https://github.com/owner/repo/pull/1?return_to=/owner/repo/actions/runs/123456",
+        None,
+        id="run-path-in-query",
+    ),
+    pytest.param(
+        "https://github.com/owner/repo/pull/1#/actions/runs/123456",
+        None,
+        id="run-path-in-fragment",
+    ),
+    pytest.param(
+        "https://github.com/owner/repo/actions/runs/999999999999999999",
+        999999999999999999,
+        id="very-long-run-id",
+    ),
+    # Not a valid GitHub Actions URL
+    pytest.param(
+        "https://github.com///owner//repo//actions//runs//123456///",
+        None,
+        id="repeated-slashes",
+    ),
+)
 
 
 class TestExtractRunIdFromUrl:
     """Test the improved URL parsing for GitHub Actions URLs."""
 
-    def test_valid_standard_url(self):
-        """Test parsing of standard GitHub Actions URL."""
-        url = "https://github.com/owner/repo/actions/runs/123456/jobs/789"
-        assert _extract_run_id_from_url(url) == 123456
-
-    def test_valid_url_without_job_id(self):
-        """Test parsing URL that ends with run ID."""
-        url = "https://github.com/owner/repo/actions/runs/987654"
-        assert _extract_run_id_from_url(url) == 987654
-
-    def test_valid_url_with_query_params(self):
-        """Test parsing URL with query parameters."""
-        url = "https://github.com/owner/repo/actions/runs/555555?check_suite_focus=true"
-        assert _extract_run_id_from_url(url) == 555555
-
-    def test_valid_url_with_fragment(self):
-        """Test parsing URL with fragment."""
-        url = "https://github.com/owner/repo/actions/runs/111111#step:1:1"
-        assert _extract_run_id_from_url(url) == 111111
-
-    def test_edge_case_empty_string(self):
-        """Test parsing empty string."""
-        assert _extract_run_id_from_url("") is None
-
-    def test_edge_case_none_input(self):
-        """Test parsing None input."""
-        assert _extract_run_id_from_url(None) is None
-
-    def test_edge_case_no_actions_runs(self):
-        """Test URL that doesn't contain 'actions/runs'."""
-        url = "https://github.com/owner/repo/issues/123"
-        assert _extract_run_id_from_url(url) is None
-
-    def test_edge_case_malformed_url(self):
-        """Test malformed URL that would break split() method."""
-        url = "https://github.com/owner/repo/actions/runs/"
-        assert _extract_run_id_from_url(url) is None
+    @pytest.mark.parametrize("url, expected", _CASES)
+    def test_extract(self, url, expected):
+        """Test run ID extraction across valid, edge-case and malformed URLs."""
+        assert _extract_run_id_from_url(url) == expected
 
-    def test_edge_case_non_numeric_run_id(self):
-        """Test URL with non-numeric run ID."""
-        url = "https://github.com/owner/repo/actions/runs/not-a-number"
-        assert _extract_run_id_from_url(url) is None
-
-    def test_edge_case_multiple_runs_segments(self):
-        """Test URL with multiple 'runs' segments (edge case)."""
-        # This is a contrived case but tests robustness
-        url = "https://github.com/runs/repo/actions/runs/123456"
-        assert _extract_run_id_from_url(url) == 123456
+    def test_repeat_urls_are_memoized(self):
+        """Test that extracting the same URL again is served from the cache."""
+        url = "https://github.com/owner/repo/actions/runs/424242/job/1"
+        hits_before = _cached_extract.cache_info().hits
 
-    def test_edge_case_runs_at_end(self):
-        """Test URL ending with 'runs' but no ID."""
-        url = "https://github.com/owner/repo/actions/runs"
-        assert _extract_run_id_from_url(url) is None
+        assert _extract_run_id_from_url(url) == 424242
+        assert _extract_run_id_from_url(url) == 424242
 
-    def test_edge_case_invalid_url_format(self):
-        """Test completely invalid URL format."""
-        url = "not-a-url-at-all"
-        assert _extract_run_id_from_url(url) is None
-
-    def test_edge_case_actions_runs_in_domain(self):
-        """Test URL with 'actions/runs' in domain name (shouldn't match)."""
-        url = "https://actions-runs.example.com/some/path"
-        assert _extract_run_id_from_url(url) is None
-
-    def test_robustness_very_long_run_id(self):
-        """Test with very long run ID (should still work)."""
-        url = "https://github.com/owner/repo/actions/runs/999999999999999999"
-        assert _extract_run_id_from_url(url) == 999999999999999999
-
-    def test_robustness_leading_trailing_slashes(self):
-        """Test that malformed URLs with multiple slashes return None."""
-        url = "https://github.com///owner//repo//actions//runs//123456///"
-        # This malformed URL should return None since it's not a valid GitHub Actions URL
-        assert _extract_run_id_from_url(url) is None
+        assert _cached_extract.cache_info().hits > hits_before
 
 
 # Regression tests for the old split() method issues